@@ -5,7 +5,6 @@ import logging
 import argparse
 import webbrowser
 import threading
-import time
 
 # Configure logging
 logging.basicConfig(
@@ -13,10 +12,11 @@ logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 
-def open_browser(url, delay=2):
-    """Open the browser after a short delay."""
-    time.sleep(delay)
-    webbrowser.open(url)
+def schedule_browser(url, delay=2):
+    """Open the browser after a short delay, without holding a thread open."""
+    timer = threading.Timer(delay, webbrowser.open_new_tab, args=(url,))
+    timer.daemon = True
+    timer.start()
 
 def main():
     """Run the CinemaCal webapp."""
@@ -39,10 +39,7 @@ def main():
     )
     
     args = parser.parse_args()
-    
-    from src.ui.webapp.app import create_app
-    
-    app = create_app()
+
     url = f"http://{args.host}:{args.port}"
     # Prefer localhost in browser to avoid 403 from software that blocks 127.0.0.1
     browser_url = f"http://localhost:{args.port}" if args.host == "127.0.0.1" else url
@@ -56,10 +53,21 @@ def main():
     
     # Open browser automatically unless --no-browser flag is set
     if not args.no_browser:
-        browser_thread = threading.Thread(target=open_browser, args=(browser_url,), daemon=True)
-        browser_thread.start()
-    
-    app.run(host=args.host, port=args.port, debug=False)
+        schedule_browser(browser_url)
+
+    # Prefer uvicorn (ASGI) so requests are handled concurrently; fall back
+    # to the single-threaded Flask dev server if it's not installed.
+    try:
+        import uvicorn
+        from src.ui.webapp.app import create_asgi_app
+    except ImportError:
+        uvicorn = None
+
+    if uvicorn is not None:
+        uvicorn.run(create_asgi_app(), host=args.host, port=args.port, log_level="info")
+    else:
+        from src.ui.webapp.app import create_app
+        create_app().run(host=args.host, port=args.port, debug=False)
 
 
 if __name__ == "__main__":
@@ -1,10 +1,18 @@
 """Export screenings to Google Calendar via API."""
 
+import asyncio
+import atexit
 import logging
 import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date, timedelta
+from operator import itemgetter
 from pathlib import Path
 from typing import Optional, List, Any
+from zoneinfo import ZoneInfo
 
 from ..models import Screening
 
@@ -13,26 +21,72 @@ logger = logging.getLogger(__name__)
 # Calendar name we add events to
 MOVIE_SCREENINGS_CALENDAR_NAME = "Movie Screenings"
 
+# Boston timezone for RFC3339 range bounds (handles the EST/EDT switch)
+BOSTON_TZ = ZoneInfo("America/New_York")
+
+# Google batch endpoint accepts at most 50 calendar operations per request
+MAX_BATCH_SIZE = 50
+
+# Max threads for concurrent API calls (avoids hammering the API)
+MAX_CONCURRENT_REQUESTS = 8
+
+# Fixed pool shared by export batches and calendar listing, so repeated
+# calls don't pay thread-pool spawn/teardown per invocation
+_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS, thread_name_prefix="gcal")
+atexit.register(_EXECUTOR.shutdown, wait=False)
+
 # Try to import Google API libraries
 GOOGLE_API_AVAILABLE = False
 try:
     from google.oauth2.credentials import Credentials
     from google.auth.transport.requests import Request
     from google_auth_oauthlib.flow import InstalledAppFlow
-    from googleapiclient.discovery import build
+    from googleapiclient.discovery import build, build_from_document
     from googleapiclient.errors import HttpError
     GOOGLE_API_AVAILABLE = True
+    # Speed up request/response JSON handling when orjson is installed
+    from ._json_patch import apply as _apply_json_patch
+    _apply_json_patch()
 except ImportError:
     logger.info("Google API libraries not installed - Google Calendar export will be disabled")
 
 # OAuth2 scope: full calendar access (required to list calendars and add events)
 SCOPES = ["https://www.googleapis.com/auth/calendar"]
 
+# Refresh tokens this far ahead of expiry so they can't lapse mid-export
+# (mirrors the ~3m45s threshold used by Google's own auth libraries)
+CREDENTIALS_REFRESH_WINDOW = timedelta(minutes=3, seconds=45)
+
 # Default paths for credentials (project config directory)
 _PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 DEFAULT_CREDENTIALS_PATH = _PROJECT_ROOT / "config" / "credentials.json"
 DEFAULT_TOKEN_PATH = _PROJECT_ROOT / "config" / "token.json"
 
+# Optional local copy of the calendar-v3 discovery document; if absent we use
+# the static doc bundled with google-api-python-client. Either way build()
+# never has to fetch discovery JSON over the network.
+DISCOVERY_DOC_PATH = _PROJECT_ROOT / "config" / "calendar-v3-discovery.json"
+_discovery_doc: Optional[str] = None
+
+
+def _get_discovery_doc() -> Optional[str]:
+    """Load the calendar-v3 discovery document once (local file or bundled)."""
+    global _discovery_doc
+    if _discovery_doc is not None:
+        return _discovery_doc
+    if DISCOVERY_DOC_PATH.exists():
+        try:
+            _discovery_doc = DISCOVERY_DOC_PATH.read_text(encoding="utf-8")
+            return _discovery_doc
+        except Exception as e:
+            logger.warning(f"Failed to read local discovery document: {e}")
+    try:
+        from googleapiclient.discovery_cache import get_static_doc
+        _discovery_doc = get_static_doc("calendar", "v3")
+    except Exception as e:
+        logger.debug(f"No static discovery document available: {e}")
+    return _discovery_doc
+
 
 def is_google_calendar_configured() -> bool:
     """Check if Google Calendar API is configured and available."""
@@ -74,15 +128,21 @@ def get_credentials() -> Optional['Credentials']:
         except Exception as e:
             logger.warning(f"Failed to load saved credentials: {e}")
     
-    # Refresh or get new credentials
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
+    # Refresh when expired, or proactively when close to expiry (a token that
+    # lapses mid-export causes a 401 and a blocking re-auth round-trip)
+    needs_refresh = bool(
+        creds and creds.expiry
+        and creds.expiry - datetime.utcnow() < CREDENTIALS_REFRESH_WINDOW
+    )
+
+    if not creds or not creds.valid or needs_refresh:
+        if creds and creds.refresh_token and (creds.expired or needs_refresh):
             try:
                 creds.refresh(Request())
             except Exception as e:
                 logger.warning(f"Failed to refresh credentials: {e}")
                 creds = None
-        
+
         if not creds:
             try:
                 flow = InstalledAppFlow.from_client_secrets_file(
@@ -104,20 +164,82 @@ def get_credentials() -> Optional['Credentials']:
     return creds
 
 
+# Cached credentials and service client. build() re-parses the discovery
+# document on every call, so rebuilding per request is needlessly expensive.
+_service_lock = threading.Lock()
+_creds_cache: Optional['Credentials'] = None
+_service_cache: Optional[Any] = None
+
+
+def _get_service() -> Optional[Any]:
+    """Get a Google Calendar service client, reusing the cached one if valid."""
+    global _creds_cache, _service_cache
+    if not GOOGLE_API_AVAILABLE:
+        return None
+    with _service_lock:
+        if _service_cache is not None and _creds_cache is not None and _creds_cache.valid:
+            return _service_cache
+        creds = get_credentials()
+        if not creds:
+            return None
+        try:
+            doc = _get_discovery_doc()
+            if doc:
+                service = build_from_document(doc, credentials=creds)
+            else:
+                service = build("calendar", "v3", credentials=creds, cache_discovery=False)
+        except Exception as e:
+            logger.error(f"Failed to build Google Calendar service: {e}")
+            return None
+        _creds_cache = creds
+        _service_cache = service
+        return service
+
+
+# Calendar-list data changes rarely; cache it briefly so exports and
+# single-event adds don't pay a list round-trip every time.
+CALENDAR_LIST_CACHE_TTL = 600  # seconds
+_calendars_cache: Optional[tuple[float, List[dict]]] = None
+# Resolved 'Movie Screenings' calendar id, keyed by the env override in effect
+_calendar_id_cache: Optional[tuple[str, str]] = None
+
+
+def invalidate_calendar_cache():
+    """Drop cached calendar list and resolved calendar id.
+
+    Call after the user reconfigures calendars so the next lookup refetches.
+    """
+    global _calendars_cache, _calendar_id_cache
+    _calendars_cache = None
+    _calendar_id_cache = None
+
+
+def _invalidate_service_cache():
+    """Drop the cached service/credentials (e.g. after a 401)."""
+    global _creds_cache, _service_cache
+    with _service_lock:
+        _creds_cache = None
+        _service_cache = None
+
+
+def _handle_http_error(e: 'HttpError'):
+    """Invalidate the cached service if an API call came back unauthorized."""
+    if getattr(e, "resp", None) is not None and e.resp.status == 401:
+        _invalidate_service_cache()
+
+
+# Format tags: *mm (35mm, 70mm, 16mm) or "Screening on film"
+_FORMAT_TAG_RE = re.compile(r"^(?:\d{1,3}mm|Screening on film)$")
+
+
 def _format_tags_for_title(special_attributes: Optional[List[str]]) -> str:
     """Extract format-style tags (35mm, 70mm, etc.) for appending to event title."""
     if not special_attributes:
         return ""
-    # Format tags: *mm (35mm, 70mm, 16mm) or "Screening on film"
-    format_tags = []
-    for attr in special_attributes:
-        a = attr.strip()
-        if not a:
-            continue
-        if a.endswith("mm") and len(a) <= 5 and a[:-2].isdigit():
-            format_tags.append(a)
-        elif a == "Screening on film":
-            format_tags.append(a)
+    format_tags = [
+        a for a in (attr.strip() for attr in special_attributes)
+        if a and _FORMAT_TAG_RE.match(a)
+    ]
     if not format_tags:
         return ""
     return " (" + ", ".join(format_tags) + ")"
@@ -176,37 +298,95 @@ def export_to_google_calendar(
         logger.warning("No screenings to export")
         return 0, 0
 
+    # Drop duplicates up front; each duplicate would cost an API insert
+    seen: set = set()
+    unique = [s for s in screenings if not (s.unique_id in seen or seen.add(s.unique_id))]
+    if len(unique) < len(screenings):
+        logger.info(f"Skipped {len(screenings) - len(unique)} duplicate screening(s)")
+    screenings = unique
+
     if calendar_id is None:
         calendar_id = get_movie_screenings_calendar_id()
 
-    creds = get_credentials()
-    if not creds:
-        logger.error("Failed to get Google Calendar credentials")
+    service = _get_service()
+    if not service:
+        logger.error("Failed to get Google Calendar service")
         return 0, len(screenings)
 
-    try:
-        service = build("calendar", "v3", credentials=creds)
-    except Exception as e:
-        logger.error(f"Failed to build Google Calendar service: {e}")
-        return 0, len(screenings)
+    success_count, failure_count = asyncio.run(
+        _export_to_google_calendar_async(service, screenings, calendar_id)
+    )
+
+    logger.info(f"Google Calendar export complete: {success_count} added, {failure_count} failed")
+    return success_count, failure_count
+
 
+async def _export_to_google_calendar_async(
+    service: Any,
+    screenings: List[Screening],
+    calendar_id: str,
+) -> tuple[int, int]:
+    """Insert screenings as batched requests, executing batches concurrently."""
     success_count = 0
     failure_count = 0
-
+    titles_by_request_id = {s.unique_id: s.title for s in screenings}
+
+    # Each batch tallies into its own counter pair: callbacks for one batch
+    # run inside that batch's execute() thread, so per-batch counts need no
+    # synchronization, and the totals are summed after the gather. A shared
+    # counter would race across the concurrently executing batches.
+    def _new_batch() -> tuple[Any, List[int]]:
+        counts = [0, 0]  # [successes, failures]
+
+        def _on_batch_response(request_id, response, exception):
+            if exception is not None:
+                title = titles_by_request_id.get(request_id, request_id)
+                logger.error(f"Failed to add event '{title}': {exception}")
+                counts[1] += 1
+            else:
+                counts[0] += 1
+
+        return service.new_batch_http_request(callback=_on_batch_response), counts
+
+    # Batch inserts (max 50 per batch) so N screenings cost ~N/50 round-trips
+    # instead of one HTTPS round-trip per event.
+    batches: List[tuple[Any, int, List[int]]] = []
+    batch, counts = _new_batch()
+    batch_size = 0
     for screening in screenings:
         try:
             event = create_google_event(screening)
-            service.events().insert(calendarId=calendar_id, body=event).execute()
-            success_count += 1
-            logger.debug(f"Added event: {screening.title}")
-        except HttpError as e:
-            logger.error(f"Failed to add event '{screening.title}': {e}")
-            failure_count += 1
+            batch.add(
+                service.events().insert(calendarId=calendar_id, body=event),
+                request_id=screening.unique_id,
+            )
+            batch_size += 1
         except Exception as e:
             logger.error(f"Unexpected error adding '{screening.title}': {e}")
             failure_count += 1
-    
-    logger.info(f"Google Calendar export complete: {success_count} added, {failure_count} failed")
+            continue
+        if batch_size >= MAX_BATCH_SIZE:
+            batches.append((batch, batch_size, counts))
+            batch, counts = _new_batch()
+            batch_size = 0
+    if batch_size:
+        batches.append((batch, batch_size, counts))
+
+    # Execute batches concurrently; each execute() is a blocking HTTP call,
+    # so run them in the shared bounded thread pool.
+    loop = asyncio.get_running_loop()
+    results = await asyncio.gather(
+        *[loop.run_in_executor(_EXECUTOR, b.execute) for b, _, _ in batches],
+        return_exceptions=True,
+    )
+    for (_, size, batch_counts), result in zip(batches, results):
+        if isinstance(result, Exception):
+            logger.error(f"Batch insert failed: {result}")
+            failure_count += size
+        else:
+            success_count += batch_counts[0]
+            failure_count += batch_counts[1]
+
     return success_count, failure_count
 
 
@@ -217,7 +397,11 @@ def _to_rfc3339(dt: Any, end_of_day: bool = False) -> str:
             dt = datetime.combine(dt, datetime.max.time().replace(microsecond=0))
         else:
             dt = datetime.combine(dt, datetime.min.time())
-    return dt.strftime("%Y-%m-%dT%H:%M:%S") + "-05:00"
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=BOSTON_TZ)
+    else:
+        dt = dt.astimezone(BOSTON_TZ)
+    return dt.isoformat(timespec="seconds")
 
 
 def list_events(
@@ -235,17 +419,8 @@ def list_events(
     Returns:
         List of dicts with id, summary, start, end, and cinemacal_screening_id if present
     """
-    if not GOOGLE_API_AVAILABLE:
-        return []
-
-    creds = get_credentials()
-    if not creds:
-        return []
-
-    try:
-        service = build("calendar", "v3", credentials=creds)
-    except Exception as e:
-        logger.error(f"Failed to build Google Calendar service: {e}")
+    service = _get_service()
+    if not service:
         return []
 
     if time_min is None:
@@ -256,27 +431,39 @@ def list_events(
     time_min_str = _to_rfc3339(time_min)
     time_max_str = _to_rfc3339(time_max, end_of_day=True)
 
+    # Paginate: a single un-paginated list() call silently truncates busy
+    # calendars at the default page size.
+    items: List[dict] = []
+    page_token = None
     try:
-        result = (
-            service.events()
-            .list(
-                calendarId=calendar_id,
-                timeMin=time_min_str,
-                timeMax=time_max_str,
-                singleEvents=True,
-                orderBy="startTime",
+        while True:
+            result = (
+                service.events()
+                .list(
+                    calendarId=calendar_id,
+                    timeMin=time_min_str,
+                    timeMax=time_max_str,
+                    singleEvents=True,
+                    orderBy="startTime",
+                    maxResults=2500,
+                    pageToken=page_token,
+                )
+                .execute()
             )
-            .execute()
-        )
+            items.extend(result.get("items", []))
+            page_token = result.get("nextPageToken")
+            if not page_token:
+                break
     except HttpError as e:
         logger.error(f"Failed to list events: {e}")
+        _handle_http_error(e)
         return []
     except Exception as e:
         logger.error(f"Unexpected error listing events: {e}")
         return []
 
     events = []
-    for item in result.get("items", []):
+    for item in items:
         start = item.get("start", {})
         end = item.get("end", {})
         start_str = start.get("dateTime") or start.get("date", "")
@@ -308,9 +495,14 @@ def list_events_from_calendars(
     if not calendar_ids:
         return []
     calendars_by_id = {c["id"]: c for c in get_calendar_list()}
+    results = asyncio.run(
+        _list_events_from_calendars_async(calendar_ids, time_min, time_max)
+    )
     all_events = []
-    for cid in calendar_ids:
-        events = list_events(calendar_id=cid, time_min=time_min, time_max=time_max)
+    for cid, events in zip(calendar_ids, results):
+        if isinstance(events, Exception):
+            logger.error(f"Failed to list events for calendar {cid}: {events}")
+            continue
         cal = calendars_by_id.get(cid, {})
         summary = cal.get("summaryOverride") or cal.get("summary") or cid
         for ev in events:
@@ -319,10 +511,26 @@ def list_events_from_calendars(
             ev["calendar_summary"] = summary
             all_events.append(ev)
     # Sort by start time (string comparison is ok for ISO-ish strings)
-    all_events.sort(key=lambda e: e.get("start", "") or "")
+    all_events.sort(key=itemgetter("start"))
     return all_events
 
 
+async def _list_events_from_calendars_async(
+    calendar_ids: List[str],
+    time_min: Optional[Any],
+    time_max: Optional[Any],
+) -> List[Any]:
+    """Fetch each calendar's events concurrently (latency = max RTT, not sum)."""
+    loop = asyncio.get_running_loop()
+    return await asyncio.gather(
+        *[
+            loop.run_in_executor(_EXECUTOR, list_events, cid, time_min, time_max)
+            for cid in calendar_ids
+        ],
+        return_exceptions=True,
+    )
+
+
 def delete_event(calendar_id: str, event_id: str) -> bool:
     """Delete an event from a calendar.
 
@@ -333,19 +541,16 @@ def delete_event(calendar_id: str, event_id: str) -> bool:
     Returns:
         True if deleted, False on error
     """
-    if not GOOGLE_API_AVAILABLE:
-        return False
-
-    creds = get_credentials()
-    if not creds:
+    service = _get_service()
+    if not service:
         return False
 
     try:
-        service = build("calendar", "v3", credentials=creds)
         service.events().delete(calendarId=calendar_id, eventId=event_id).execute()
         return True
     except HttpError as e:
         logger.error(f"Failed to delete event {event_id}: {e}")
+        _handle_http_error(e)
         return False
     except Exception as e:
         logger.error(f"Unexpected error deleting event {event_id}: {e}")
@@ -371,17 +576,17 @@ def add_screening_to_calendar(
     if calendar_id is None:
         calendar_id = get_movie_screenings_calendar_id()
 
-    creds = get_credentials()
-    if not creds:
+    service = _get_service()
+    if not service:
         return None
 
     try:
-        service = build("calendar", "v3", credentials=creds)
         event = create_google_event(screening)
         created = service.events().insert(calendarId=calendar_id, body=event).execute()
         return created.get("id")
     except HttpError as e:
         logger.error(f"Failed to add event '{screening.title}': {e}")
+        _handle_http_error(e)
         return None
     except Exception as e:
         logger.error(f"Unexpected error adding '{screening.title}': {e}")
@@ -391,18 +596,20 @@ def add_screening_to_calendar(
 def get_calendar_list() -> List[dict]:
     """Get list of user's Google Calendars.
 
+    Results are cached for CALENDAR_LIST_CACHE_TTL seconds.
+
     Returns:
         List of calendar dictionaries with 'id', 'summary', and 'summaryOverride'
     """
-    if not GOOGLE_API_AVAILABLE:
-        return []
+    global _calendars_cache
+    if _calendars_cache and time.monotonic() - _calendars_cache[0] < CALENDAR_LIST_CACHE_TTL:
+        return _calendars_cache[1]
 
-    creds = get_credentials()
-    if not creds:
+    service = _get_service()
+    if not service:
         return []
 
     try:
-        service = build("calendar", "v3", credentials=creds)
         calendars = []
         page_token = None
         while True:
@@ -420,6 +627,7 @@ def get_calendar_list() -> List[dict]:
             page_token = calendars_result.get("nextPageToken")
             if not page_token:
                 break
+        _calendars_cache = (time.monotonic(), calendars)
         return calendars
     except Exception as e:
         logger.error(f"Failed to get calendar list: {e}")
@@ -432,11 +640,15 @@ def get_movie_screenings_calendar_id() -> str:
     Uses GOOGLE_CALENDAR_ID env var if set; otherwise finds a calendar whose
     name (summary or summaryOverride) matches 'Movie Screenings' case-insensitively.
     """
+    global _calendar_id_cache
     if not GOOGLE_API_AVAILABLE:
         return "primary"
     override_id = os.environ.get("GOOGLE_CALENDAR_ID", "").strip()
+    if _calendar_id_cache and _calendar_id_cache[0] == override_id:
+        return _calendar_id_cache[1]
     if override_id:
         logger.info("Using calendar id from GOOGLE_CALENDAR_ID: %s", override_id)
+        _calendar_id_cache = (override_id, override_id)
         return override_id
     target = MOVIE_SCREENINGS_CALENDAR_NAME.strip().lower()
     if not target:
@@ -447,6 +659,7 @@ def get_movie_screenings_calendar_id() -> str:
         override = (cal.get("summaryOverride") or "").strip().lower()
         if summary == target or override == target:
             logger.info("Using calendar '%s' (id=%s)", MOVIE_SCREENINGS_CALENDAR_NAME, cal["id"])
+            _calendar_id_cache = (override_id, cal["id"])
             return cal["id"]
     logger.warning(
         "Calendar '%s' not found; using primary. Create a calendar named exactly '%s' to use it, or set GOOGLE_CALENDAR_ID to the calendar id.",
@@ -1,59 +1,76 @@
 """Export screenings to .ics calendar format."""
 
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 import webbrowser
 
-from icalendar import Calendar, Event, vText
-import pytz
-
 from ..models import Screening, get_venue_address
 
 logger = logging.getLogger(__name__)
 
-# Boston timezone
-BOSTON_TZ = pytz.timezone("America/New_York")
+# Boston timezone (events are rendered with TZID references)
+BOSTON_TZID = "America/New_York"
 
+# RFC 5545 TEXT escaping: backslash, semicolon, comma, newline
+_ICS_ESCAPE = str.maketrans({"\\": "\\\\", ";": "\\;", ",": "\\,", "\n": "\\n"})
 
-def create_calendar_event(screening: Screening) -> Event:
-    """Create an iCalendar event from a Screening."""
-    event = Event()
-    
-    # Summary: "Film Title @ Venue"
-    summary = f"{screening.title} @ {screening.venue}"
-    event.add("summary", summary)
-    
-    # Start time (with timezone)
+# Static calendar header/footer (CRLF-delimited per RFC 5545)
+_CALENDAR_HEADER = (
+    "BEGIN:VCALENDAR\r\n"
+    "VERSION:2.0\r\n"
+    "PRODID:-//CinemaCal//EN\r\n"
+    "CALSCALE:GREGORIAN\r\n"
+    "METHOD:PUBLISH\r\n"
+    "X-WR-CALNAME:Movie Screenings\r\n"
+    f"X-WR-TIMEZONE:{BOSTON_TZID}\r\n"
+)
+_CALENDAR_FOOTER = "END:VCALENDAR\r\n"
+
+
+def _escape_text(text: str) -> str:
+    """Escape a TEXT property value per RFC 5545."""
+    return text.translate(_ICS_ESCAPE)
+
+
+def _fold_line(line: str) -> str:
+    """Fold a long content line with space-prefixed continuations (RFC 5545 3.1)."""
+    if len(line) <= 75:
+        return line
+    chunks = [line[:75]]
+    rest = line[75:]
+    while rest:
+        chunks.append(" " + rest[:74])
+        rest = rest[74:]
+    return "\r\n".join(chunks)
+
+
+def _render_vevent(screening: Screening) -> str:
+    """Render a Screening as a VEVENT text block.
+
+    Building the text directly is much faster than assembling icalendar
+    Event objects property by property.
+    """
     start_dt = datetime.combine(screening.date, screening.time)
-    start_dt = BOSTON_TZ.localize(start_dt)
-    event.add("dtstart", start_dt)
-    
-    # End time (start + runtime or default 2 hours)
-    if screening.runtime_minutes:
-        duration = timedelta(minutes=screening.runtime_minutes)
-    else:
-        duration = timedelta(hours=2)
-    end_dt = start_dt + duration
-    event.add("dtend", end_dt)
-    
-    # Location
+    end_dt = screening.datetime_end
+
+    summary = f"{screening.title} @ {screening.venue}"
+
     address = get_venue_address(screening.venue)
     if address:
-        event.add("location", vText(f"{screening.venue}, {address}"))
+        location = f"{screening.venue}, {address}"
     else:
-        event.add("location", vText(screening.venue))
-    
-    # Description with details
+        location = screening.venue
+
     description_parts = []
-    
+
     if screening.director:
         description_parts.append(f"Director: {screening.director}")
-    
+
     if screening.year:
         description_parts.append(f"Year: {screening.year}")
-    
+
     if screening.runtime_minutes:
         hours = screening.runtime_minutes // 60
         mins = screening.runtime_minutes % 60
@@ -63,67 +80,89 @@ def create_calendar_event(screening: Screening) -> Event:
             description_parts.append(f"Runtime: {hours}h")
         else:
             description_parts.append(f"Runtime: {mins}m")
-    
+
     if screening.special_attributes:
         description_parts.append(f"Special: {', '.join(screening.special_attributes)}")
     if screening.extra:
         description_parts.append(f"Notes: {screening.extra}")
-    
+
     description_parts.append(f"Source: {screening.source_site}")
     description_parts.append(f"URL: {screening.source_url}")
-    
-    event.add("description", "\n".join(description_parts))
-    
-    # Unique ID based on screening details
-    uid = f"{screening.unique_id}@cinemacal"
-    event.add("uid", uid)
-    
-    # Creation timestamp
-    event.add("dtstamp", datetime.now(pytz.UTC))
-    
-    return event
-
-
-def export_to_ics(screenings: list[Screening], filepath: str) -> str:
+
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{screening.unique_id}@cinemacal",
+        f"DTSTAMP:{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S')}Z",
+        f"DTSTART;TZID={BOSTON_TZID}:{start_dt.strftime('%Y%m%dT%H%M%S')}",
+        f"DTEND;TZID={BOSTON_TZID}:{end_dt.strftime('%Y%m%dT%H%M%S')}",
+        f"SUMMARY:{_escape_text(summary)}",
+        f"LOCATION:{_escape_text(location)}",
+        f"DESCRIPTION:{_escape_text(chr(10).join(description_parts))}",
+        "END:VEVENT",
+    ]
+    return "\r\n".join(_fold_line(line) for line in lines) + "\r\n"
+
+
+def iter_ics_chunks(screenings: Iterable[Screening]) -> Iterator[bytes]:
+    """Yield the calendar as encoded chunks, one event at a time.
+
+    Screenings may be any iterable (including a generator); consumers that
+    stream the chunks keep peak memory O(1).
+    """
+    yield _CALENDAR_HEADER.encode("utf-8")
+    count = 0
+    skipped = 0
+    seen: set = set()
+    for screening in screenings:
+        try:
+            uid = screening.unique_id
+            if uid in seen:
+                skipped += 1
+                continue
+            seen.add(uid)
+            chunk = _render_vevent(screening).encode("utf-8")
+        except Exception as e:
+            logger.warning(f"Failed to create event for {screening.title}: {e}")
+            continue
+        yield chunk
+        count += 1
+    yield _CALENDAR_FOOTER.encode("utf-8")
+
+    if skipped:
+        logger.info(f"Skipped {skipped} duplicate screening(s)")
+    if count == 0:
+        logger.warning("No screenings to export")
+    logger.info(f"Exported {count} screenings")
+
+
+def export_to_ics_bytes(screenings: Iterable[Screening]) -> bytes:
+    """Render screenings to .ics calendar bytes, entirely in memory."""
+    return b"".join(iter_ics_chunks(screenings))
+
+
+def export_to_ics(screenings: Iterable[Screening], filepath: str) -> str:
     """Export screenings to an .ics file.
-    
+
+    Events are rendered and written one at a time, so screenings may be any
+    iterable (including a generator) and peak memory stays O(1).
+
     Args:
-        screenings: List of Screening objects to export
+        screenings: Iterable of Screening objects to export
         filepath: Path to save the .ics file
-        
+
     Returns:
         The filepath where the calendar was saved
     """
     if not screenings:
         logger.warning("No screenings to export")
         return filepath
-    
-    # Create calendar
-    cal = Calendar()
-    cal.add("prodid", "-//CinemaCal//EN")
-    cal.add("version", "2.0")
-    cal.add("calscale", "GREGORIAN")
-    cal.add("method", "PUBLISH")
-    cal.add("x-wr-calname", "Movie Screenings")
-    cal.add("x-wr-timezone", "America/New_York")
-    
-    # Add events
-    for screening in screenings:
-        try:
-            event = create_calendar_event(screening)
-            cal.add_component(event)
-        except Exception as e:
-            logger.warning(f"Failed to create event for {screening.title}: {e}")
-            continue
-    
-    # Write to file
+
     path = Path(filepath)
     path.parent.mkdir(parents=True, exist_ok=True)
-    
+
     with open(path, "wb") as f:
-        f.write(cal.to_ical())
-    
-    logger.info(f"Exported {len(screenings)} screenings to {filepath}")
+        for chunk in iter_ics_chunks(screenings):
+            f.write(chunk)
     return str(path.absolute())
 
 
@@ -2,14 +2,15 @@
 
 from dataclasses import dataclass, field
 from datetime import date, time, datetime, timedelta
+from functools import lru_cache
 from typing import Optional, List
 import hashlib
 
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class Screening:
     """Represents a single movie screening."""
-    
+
     title: str
     venue: str
     date: date
@@ -22,23 +23,56 @@ class Screening:
     extra: Optional[str] = None  # e.g., free-form notes
     # Structured special attributes: format (35mm, screening on film), event type (panel discussion, Q&A, etc.)
     special_attributes: Optional[List[str]] = None
-    
+    # Memoized unique_id (computed on first access)
+    _uid: Optional[str] = field(default=None, repr=False, compare=False)
+    # Precomputed datetimes (pure functions of the fields above; computing
+    # once avoids a datetime.combine per sort key / event-creation access)
+    _dt_start: datetime = field(init=False, repr=False, compare=False)
+    _dt_end: datetime = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._dt_start = datetime.combine(self.date, self.time)
+        duration = timedelta(minutes=self.runtime_minutes) if self.runtime_minutes else timedelta(hours=2)
+        self._dt_end = self._dt_start + duration
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "Screening":
+        """Build a Screening from its serialized dict form.
+
+        time.fromisoformat is C-implemented and accepts the "%H:%M:%S"
+        strings the API serializes, so no strptime format parse is needed.
+        """
+        return cls(
+            title=d["title"],
+            venue=d["venue"],
+            date=date.fromisoformat(d["date"]),
+            time=time.fromisoformat(d["time"]),
+            source_url=d["source_url"],
+            source_site=d["source_site"],
+            runtime_minutes=d.get("runtime_minutes"),
+            director=d.get("director"),
+            year=d.get("year"),
+            extra=d.get("extra"),
+            special_attributes=d.get("special_attributes") or None,
+        )
+
     @property
     def datetime_start(self) -> datetime:
         """Get the start datetime of the screening."""
-        return datetime.combine(self.date, self.time)
-    
+        return self._dt_start
+
     @property
     def datetime_end(self) -> datetime:
         """Get the end datetime (start + runtime, or +2h default for films)."""
-        duration = timedelta(minutes=self.runtime_minutes) if self.runtime_minutes else timedelta(hours=2)
-        return self.datetime_start + duration
+        return self._dt_end
     
     @property
     def unique_id(self) -> str:
         """Generate a unique ID for this screening based on key fields."""
-        key = f"{self.title}|{self.venue}|{self.date}|{self.time}"
-        return hashlib.md5(key.encode()).hexdigest()[:12]
+        if self._uid is None:
+            key = f"{self.title}|{self.venue}|{self.date}|{self.time}"
+            self._uid = hashlib.blake2b(key.encode(), digest_size=6).hexdigest()
+        return self._uid
     
     def __str__(self) -> str:
         time_str = self.time.strftime("%I:%M %p")
@@ -61,7 +95,7 @@ class Screening:
                 self.time == other.time)
 
 
-@dataclass
+@dataclass(slots=True)
 class ScraperConfig:
     """Configuration for scrapers."""
     
@@ -82,6 +116,7 @@ class ScraperConfig:
     # Cache settings (for development)
     use_cache: bool = False
     cache_dir: str = ".cache"
+    cache_ttl_seconds: int = 3600  # serve cached pages this long before revalidating
     
     @property
     def end_date(self) -> date:
@@ -108,10 +143,20 @@ VENUE_ADDRESSES = {
 }
 
 
+# Precomputed lowercase lookup so exact matches are O(1); the fuzzy
+# substring scan only runs on a miss.
+_VENUE_LOWER = {name.lower(): address for name, address in VENUE_ADDRESSES.items()}
+_VENUE_TOKENS = list(_VENUE_LOWER.items())
+
+
+@lru_cache(maxsize=256)
 def get_venue_address(venue: str) -> Optional[str]:
     """Get the address for a venue, with fuzzy matching."""
     venue_lower = venue.lower()
-    for name, address in VENUE_ADDRESSES.items():
-        if name.lower() in venue_lower or venue_lower in name.lower():
+    address = _VENUE_LOWER.get(venue_lower)
+    if address:
+        return address
+    for name_lower, address in _VENUE_TOKENS:
+        if name_lower in venue_lower or venue_lower in name_lower:
             return address
     return None
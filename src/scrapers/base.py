@@ -1,17 +1,22 @@
 """Base scraper with common utilities."""
 
 import logging
+import re
 import time
 import json
 import hashlib
 from abc import ABC, abstractmethod
 from datetime import datetime, date, time as dt_time, timedelta
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List
 from urllib.parse import urljoin
 
-import requests
-from bs4 import BeautifulSoup
+import threading
+
+import httpx
+from bs4 import BeautifulSoup, SoupStrainer
 
 from ..models import Screening, ScraperConfig
 
@@ -24,39 +29,88 @@ USER_AGENT = (
     "Chrome/120.0.0.0 Safari/537.36"
 )
 
+# Default request headers, set once on the shared client
+DEFAULT_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+}
+
+# Shared HTTP client with keep-alive + HTTP/2 connection pooling, so repeat
+# requests to the same host skip the TCP/TLS handshake. Scrapers run on
+# threads; httpx.Client is thread-safe.
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> httpx.Client:
+    """Get the shared pooled HTTP client, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(
+                    http2=True,
+                    headers=DEFAULT_HEADERS,
+                    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+                    follow_redirects=True,
+                )
+    return _client
+
+
+def _retry_after_seconds(exc: httpx.HTTPError) -> Optional[float]:
+    """Seconds the server asked us to wait, from a 429/503 Retry-After header."""
+    response = getattr(exc, "response", None)
+    if response is None or response.status_code not in (429, 503):
+        return None
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        # HTTP-date form, e.g. "Wed, 21 Oct 2026 07:28:00 GMT"
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        seconds = (when - datetime.now(when.tzinfo)).total_seconds()
+    # Cap so a misbehaving server can't stall a scrape for minutes
+    return min(max(seconds, 0.0), 60.0)
+
 
 def fetch_with_retry(
     url: str,
     config: ScraperConfig,
     headers: Optional[dict] = None,
-) -> requests.Response:
-    """Fetch a URL with retry logic and exponential backoff."""
-    
-    default_headers = {
-        "User-Agent": USER_AGENT,
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.5",
-    }
-    if headers:
-        default_headers.update(headers)
-    
+    allow_not_modified: bool = False,
+) -> httpx.Response:
+    """Fetch a URL with retry logic and exponential backoff.
+
+    With allow_not_modified=True, a 304 Not Modified response is returned
+    as-is (for conditional requests) instead of being treated as an error.
+    """
+    client = _get_client()
+
     last_exception = None
     for attempt in range(config.max_retries):
         try:
-            response = requests.get(
-                url,
-                headers=default_headers,
-                timeout=config.timeout,
-            )
+            response = client.get(url, headers=headers, timeout=config.timeout)
+            if allow_not_modified and response.status_code == 304:
+                return response
             response.raise_for_status()
             return response
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             last_exception = e
             if attempt < config.max_retries - 1:
                 delay = config.retry_delay * (2 ** attempt)
+                # Rate-limited? Wait at least as long as the server asked
+                retry_after = _retry_after_seconds(e)
+                if retry_after is not None:
+                    delay = max(delay, retry_after)
                 logger.warning(f"Request failed (attempt {attempt + 1}), retrying in {delay}s: {e}")
                 time.sleep(delay)
-    
+
     raise last_exception
 
 
@@ -66,114 +120,123 @@ def get_soup(url: str, config: ScraperConfig) -> BeautifulSoup:
     return BeautifulSoup(response.content, "lxml")
 
 
+# The same few showtime strings repeat across films and days, so memoize
+@lru_cache(maxsize=1024)
 def parse_time(time_str: str) -> Optional[dt_time]:
-    """Parse a time string like '7:00 PM', '7:00pm', '19:00' into a time object."""
-    time_str = time_str.strip().upper().replace(" ", "")
-    
-    # Try various formats
-    formats = [
-        "%I:%M%p",   # 7:00PM
-        "%I:%M %p",  # 7:00 PM
-        "%I%p",      # 7PM
-        "%H:%M",     # 19:00
-    ]
-    
-    for fmt in formats:
-        try:
-            parsed = datetime.strptime(time_str, fmt)
-            return parsed.time()
-        except ValueError:
-            continue
-    
-    logger.warning(f"Could not parse time: {time_str}")
-    return None
+    """Parse a time string like '7:00 PM', '7:00pm', '19:00' into a time object.
+
+    The structure is trivial (digits, optional colon, optional am/pm), so
+    parse it directly rather than trying strptime formats in a loop.
+    """
+    s = time_str.strip().lower().replace(" ", "")
 
+    ampm = None
+    if s.endswith(("am", "pm")):
+        ampm = s[-2:]
+        s = s[:-2]
+
+    try:
+        if ":" in s:
+            hour_str, minute_str = s.split(":", 1)
+            hour, minute = int(hour_str), int(minute_str)
+        else:
+            hour, minute = int(s), 0
+        if ampm == "pm" and hour != 12:
+            hour += 12
+        elif ampm == "am" and hour == 12:
+            hour = 0
+        return dt_time(hour, minute)
+    except ValueError:
+        logger.warning(f"Could not parse time: {time_str}")
+        return None
 
+
+# Runtime patterns ("Xhr Ymin", plain minutes)
+_HOURS_RE = re.compile(r"(\d+)\s*h")
+_MINS_RE = re.compile(r"(\d+)\s*m")
+_PLAIN_MINUTES_RE = re.compile(r"^(\d+)")
+
+
+@lru_cache(maxsize=1024)
 def parse_runtime(runtime_str: str) -> Optional[int]:
     """Parse a runtime string like '2h 30m', '150 min', '2hrs 15mins' into minutes."""
     runtime_str = runtime_str.lower().strip()
-    
+
     total_minutes = 0
-    
-    # Handle "Xhr Ymin" format
-    import re
-    
+
     # Match hours
-    hours_match = re.search(r"(\d+)\s*h", runtime_str)
+    hours_match = _HOURS_RE.search(runtime_str)
     if hours_match:
         total_minutes += int(hours_match.group(1)) * 60
-    
+
     # Match minutes
-    mins_match = re.search(r"(\d+)\s*m", runtime_str)
+    mins_match = _MINS_RE.search(runtime_str)
     if mins_match:
         total_minutes += int(mins_match.group(1))
-    
+
     # Handle plain minutes like "150 min" or "150"
     if total_minutes == 0:
-        plain_match = re.search(r"^(\d+)", runtime_str)
+        plain_match = _PLAIN_MINUTES_RE.search(runtime_str)
         if plain_match:
             total_minutes = int(plain_match.group(1))
-    
+
     return total_minutes if total_minutes > 0 else None
 
 
+# Special-attribute vocabulary, compiled to one alternation so the page text
+# is scanned once instead of once per needle. Output order (and labels) below.
+_ATTR_RE = re.compile(
+    r"(?P<mm35>35mm)|(?P<mm70>70mm)|(?P<mm16>16mm)"
+    r"|(?P<on_film>screening on film)"
+    r"|(?P<panel>panel discussion)"
+    r"|(?P<qa>q&a|q and a)"
+    r"|(?P<in_person>in[ -]person)"
+    r"|(?P<live_music>live musical accompaniment)"
+    r"|(?P<double>double feature)"
+    r"|(?P<premiere>premiere)"
+    r"|(?P<new_release>new release)"
+    r"|(?P<spotlight>spotlight on women)"
+    r"|(?P<singalong>sing[- ]along)"
+    r"|(?P<discussion>discussion)"
+    r"|(?P<seminar>seminar)"
+)
+
+# Canonical labels, in the order attributes are reported
+_ATTR_LABELS = (
+    ("mm35", "35mm"),
+    ("mm70", "70mm"),
+    ("mm16", "16mm"),
+    ("on_film", "Screening on film"),
+    ("panel", "Panel discussion"),
+    ("qa", "Q&A"),
+    ("in_person", "Director in person"),
+    ("live_music", "Live musical accompaniment"),
+    ("double", "Double feature"),
+    ("premiere", "Premiere"),
+    ("new_release", "New Release"),
+    ("spotlight", "Spotlight on Women"),
+    ("singalong", "Sing-along"),
+    ("discussion", "Discussion"),
+    ("seminar", "Seminar"),
+)
+
+
 def extract_special_attributes(text: str) -> List[str]:
     """Extract normalized special attributes from page text (format, event type).
-    
+
     Returns a list of canonical labels such as: 35mm, 70mm, Screening on film,
     Panel discussion, Q&A, Director in person, Live musical accompaniment,
     Double feature, Premiere, New Release, etc.
     """
     if not text:
         return []
-    t = text.lower()
-    attrs: List[str] = []
-    # Format / screening on film
-    if "35mm" in t:
-        attrs.append("35mm")
-    if "70mm" in t:
-        attrs.append("70mm")
-    if "16mm" in t:
-        attrs.append("16mm")
-    if "screening on film" in t:
-        attrs.append("Screening on film")
-    if "screening on 35mm" in t or "35mm / dcp" in t:
-        if "35mm" not in attrs:
-            attrs.append("35mm")
-    if "screening on 16mm" in t or "16mm / dcp" in t:
-        if "16mm" not in attrs:
-            attrs.append("16mm")
-    # Event types
-    if "panel discussion" in t:
-        attrs.append("Panel discussion")
-    if "q&a" in t or "q and a" in t:
-        attrs.append("Q&A")
-    if "director in person" in t or "director in-person" in t or "in person" in t:
-        attrs.append("Director in person")
-    if "live musical accompaniment" in t:
-        attrs.append("Live musical accompaniment")
-    if "double feature" in t:
-        attrs.append("Double feature")
-    if "premiere" in t:
-        attrs.append("Premiere")
-    if "new release" in t:
-        attrs.append("New Release")
-    if "spotlight on women" in t:
-        attrs.append("Spotlight on Women")
-    if "sing-along" in t or "sing along" in t:
-        attrs.append("Sing-along")
-    if "discussion" in t and "Panel discussion" not in attrs:
-        attrs.append("Discussion")
-    if "seminar" in t:
-        attrs.append("Seminar")
-    # Deduplicate while preserving order
-    seen = set()
-    out = []
-    for a in attrs:
-        if a not in seen:
-            seen.add(a)
-            out.append(a)
-    return out
+    found = {m.lastgroup for m in _ATTR_RE.finditer(text.lower())}
+    if not found:
+        return []
+    # "panel discussion" subsumes the bare "discussion" label
+    if "panel" in found:
+        found.discard("discussion")
+    return [label for group, label in _ATTR_LABELS if group in found]
 
 
 def parse_date_header(date_str: str, year: Optional[int] = None) -> Optional[date]:
@@ -183,18 +246,20 @@ def parse_date_header(date_str: str, year: Optional[int] = None) -> Optional[dat
     # Use current year if not provided
     if year is None:
         year = datetime.now().year
-    
-    # Try various formats
-    formats = [
-        "%A, %B %d",      # Thursday, January 28
-        "%A, %b %d",      # Thursday, Jan 28
-        "%B %d",          # January 28
-        "%b %d",          # Jan 28
-        "%m/%d",          # 1/28
-        "%m/%d/%Y",       # 1/28/2026
-        "%Y-%m-%d",       # 2026-01-28
-    ]
-    
+
+    # Dispatch on the separator so only plausible formats are tried
+    if "/" in date_str:
+        formats = ("%m/%d", "%m/%d/%Y")
+    elif "-" in date_str:
+        formats = ("%Y-%m-%d",)
+    else:
+        formats = (
+            "%A, %B %d",      # Thursday, January 28
+            "%A, %b %d",      # Thursday, Jan 28
+            "%B %d",          # January 28
+            "%b %d",          # Jan 28
+        )
+
     for fmt in formats:
         try:
             parsed = datetime.strptime(date_str, fmt)
@@ -209,6 +274,19 @@ def parse_date_header(date_str: str, year: Optional[int] = None) -> Optional[dat
     return None
 
 
+@lru_cache(maxsize=2048)
+def _absolute_url(base: str, url: str) -> str:
+    """Resolve ``url`` against ``base``, memoized.
+
+    urljoin re-parses the base URL on every call; the same handful of hrefs
+    repeat across every page of a scrape, so cache the results and skip the
+    join entirely for already-absolute URLs.
+    """
+    if url.startswith(("http://", "https://")):
+        return url
+    return urljoin(base, url)
+
+
 class BaseScraper(ABC):
     """Base class for all scrapers."""
     
@@ -226,50 +304,105 @@ class BaseScraper(ABC):
     
     def _get_cache_path(self, url: str) -> Path:
         """Get cache file path for a URL."""
-        url_hash = hashlib.md5(url.encode()).hexdigest()[:16]
+        # blake2b with an 8-byte digest gives the 16 hex chars directly, is
+        # faster than md5 on short inputs, and works on FIPS-locked hosts
+        url_hash = hashlib.blake2b(url.encode(), digest_size=8).hexdigest()
         return self._cache_dir / f"{url_hash}.html"
     
-    def _get_cached(self, url: str) -> Optional[str]:
+    def _get_meta_path(self, url: str) -> Path:
+        """Get the sidecar metadata path (etag/last-modified) for a URL."""
+        return self._get_cache_path(url).with_suffix(".json")
+
+    def _get_cached(self, url: str) -> Optional[bytes]:
         """Get cached content for a URL if available and fresh."""
         if not self.config.use_cache:
             return None
-        
+
         cache_path = self._get_cache_path(url)
         if cache_path.exists():
-            # Check if cache is fresh (less than 1 hour old)
+            # Check if cache is fresh (within the configured TTL)
             mtime = datetime.fromtimestamp(cache_path.stat().st_mtime)
-            if datetime.now() - mtime < timedelta(hours=1):
+            if datetime.now() - mtime < timedelta(seconds=self.config.cache_ttl_seconds):
                 logger.debug(f"Using cached content for {url}")
-                return cache_path.read_text(encoding="utf-8")
-        
+                return cache_path.read_bytes()
+
         return None
-    
-    def _save_cache(self, url: str, content: str):
-        """Save content to cache."""
+
+    def _load_cache_meta(self, url: str) -> dict:
+        """Load cached response metadata (etag, last_modified) for a URL."""
+        meta_path = self._get_meta_path(url)
+        if meta_path.exists():
+            try:
+                return json.loads(meta_path.read_text(encoding="utf-8"))
+            except (json.JSONDecodeError, OSError):
+                pass
+        return {}
+
+    def _save_cache(self, url: str, content: bytes, response: Optional[httpx.Response] = None):
+        """Save content (and response validators, if any) to cache."""
         if not self.config.use_cache:
             return
-        
+
         self._cache_dir.mkdir(parents=True, exist_ok=True)
         cache_path = self._get_cache_path(url)
-        cache_path.write_text(content, encoding="utf-8")
+        cache_path.write_bytes(content)
+        if response is not None:
+            meta = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "fetched_at": datetime.now().isoformat(),
+            }
+            self._get_meta_path(url).write_text(json.dumps(meta), encoding="utf-8")
         logger.debug(f"Cached content for {url}")
-    
-    def get_soup(self, url: str) -> BeautifulSoup:
-        """Fetch a URL and return BeautifulSoup, with optional caching."""
+
+    def get_html(self, url: str) -> bytes:
+        """Fetch a URL's raw HTML bytes, with optional caching.
+
+        Bytes throughout: lxml/selectolax handle the document's own encoding
+        declaration, so the .text decode (and any charset detection) is
+        skipped, and the cache preserves the original encoding.
+        """
         # Check cache first
         cached = self._get_cached(url)
         if cached:
-            return BeautifulSoup(cached, "lxml")
-        
-        # Fetch fresh
-        response = fetch_with_retry(url, self.config)
-        content = response.text
-        
+            return cached
+
+        # Stale cache: revalidate with a conditional request when we have
+        # validators, so an unchanged page costs a 304 instead of a full body
+        headers = None
+        cache_path = self._get_cache_path(url)
+        if self.config.use_cache and cache_path.exists():
+            meta = self._load_cache_meta(url)
+            conditional = {}
+            if meta.get("etag"):
+                conditional["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                conditional["If-Modified-Since"] = meta["last_modified"]
+            headers = conditional or None
+
+        response = fetch_with_retry(
+            url, self.config, headers=headers, allow_not_modified=headers is not None
+        )
+        if response.status_code == 304:
+            logger.debug(f"Cache revalidated (304) for {url}")
+            cache_path.touch()  # reset the TTL clock
+            return cache_path.read_bytes()
+
+        content = response.content
+
         # Save to cache
-        self._save_cache(url, content)
-        
-        return BeautifulSoup(content, "lxml")
+        self._save_cache(url, content, response)
+
+        return content
+
+    def get_soup(self, url: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """Fetch a URL and return BeautifulSoup, with optional caching.
+
+        parse_only restricts tree building to a SoupStrainer, so callers that
+        need only part of the document skip materializing the rest.
+        """
+        return BeautifulSoup(self.get_html(url), "lxml", parse_only=parse_only)
     
     def make_absolute_url(self, url: str) -> str:
         """Convert a relative URL to absolute."""
-        return urljoin(self.base_url, url)
+        return _absolute_url(self.base_url, url)
@@ -4,19 +4,145 @@ import logging
 import re
 import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import replace
 from datetime import datetime, date, timedelta
-from typing import Optional, List
+from functools import lru_cache
+from typing import Iterable, Optional, List
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 
 from ..models import Screening, ScraperConfig
-from .base import BaseScraper, parse_time, extract_special_attributes
+from .base import BaseScraper, fetch_with_retry, parse_time, extract_special_attributes
+
+# Optional fast path: selectolax (Lexbor) parses a date page several times
+# faster than BeautifulSoup+lxml and the text-based parse only needs links
+# and text lines
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
 
 logger = logging.getLogger(__name__)
 
+# Card-layout detection (matches the BeautifulSoup class_ filter below)
+_RE_FILM_SECTION = re.compile(r"film|movie|showtime|event", re.I)
+
+# Precompiled patterns for the per-line text parse and the extractors; these
+# run O(lines x dates) so per-call re-module lookups add up
+_RE_ROOM_CODE = re.compile(r"^(MH\d|ECEC|MHB)$", re.I)
+_RE_RUNTIME_FULL = re.compile(r"(\d+)\s*h(?:rs?|ours?)?\s*(\d+)?\s*m(?:ins?)?", re.I)
+_RE_RUNTIME_HOURS = re.compile(r"(\d+)\s*h(?:rs?|ours?)?", re.I)
+_RE_MINS_ONLY = re.compile(r"^(\d+)\s*m(?:ins?)?$", re.I)
+_RE_HOURS_ONLY = re.compile(r"^(\d+)\s*h(?:rs?|ours?)?$", re.I)
+_RE_TIME_LINE = re.compile(r"^(\d{1,2}:\d{2}\s*(?:am|pm))(?:\s*\w+)?$", re.I)
+_RE_TIME_ANY = re.compile(r"(\d{1,2}:\d{2}\s*(?:am|pm))", re.I)
+_RE_TIME_DIGITS = re.compile(r"\d:\d{2}")
+_RE_HAS_DIGIT = re.compile(r"\d")
+_RE_YEAR = re.compile(r"\b(19\d{2}|20\d{2})\b")
+_RE_DIRECTED_BY = re.compile(r"Directed by\s+(.+?)(?:,|\s+\d{4}|$)", re.I)
+# "A frisky, feminine, film noir about..." / "An animated tale of..." openers
+_RE_LOGLINE_START = re.compile(
+    r"^a\s+[a-z]+(?:,\s+[a-z]+)*(?:\s+film\s+noir)?\s+(?:film|movie|story|tale|about)"
+    r"|^an\s+[a-z]+(?:\s+film\s+noir)?\s+(?:film|movie|story|tale|about)"
+)
+# Descriptive phrases that mark a logline, as one alternation
+_RE_LOGLINE_WORDS = re.compile(
+    r"about|frisky|feminine|film noir|tells the story|follows|explores"
+    r"|chronicles|depicts|portrays|many other things"
+)
+
+# Navigation/header items to skip during the line parse; compiled into a
+# single alternation so each line is scanned once instead of 22 times
+_SKIP_PATTERNS = (
+    "now playing", "coming soon", "calendar", "skip to", "main navigation",
+    "films & events", "education", "support us", "about us", "shop",
+    "become a member", "donate", "search", "home", "film guide",
+    "open captions", "membership", "gift cards",
+    "learn more", "new release", "cinema in 70mm", "spotlight on women",
+    "special screenings", "director in person", "speaker",
+)
+_RE_SKIP = re.compile("|".join(re.escape(p) for p in _SKIP_PATTERNS))
+
+# Non-empty line spans; iterating matches avoids materializing a list of
+# every line on the page just to walk it once
+_RE_LINE = re.compile(r"[^\n]+")
+
+
+def _iter_lines(full_text: str):
+    """Yield stripped, non-empty lines of text without building a list."""
+    for m in _RE_LINE.finditer(full_text):
+        line = m.group().strip()
+        if line:
+            yield line
+
+
 # Max concurrent requests for date pages (avoids hammering the server)
 MAX_DATE_WORKERS = 10
 
+# Both parse paths only read the document body, so skip building the <head>
+# (scripts, styles, meta) entirely
+_BODY_STRAINER = SoupStrainer("body")
+
+
+# Pure string -> value helpers, memoized at module scope: the same link text
+# and section text recur across the date pages of a scrape (films run for
+# days), so repeat inputs skip the regex work entirely
+@lru_cache(maxsize=4096)
+def _is_logline(text: str) -> bool:
+    """Check if text looks like a logline/description rather than a title."""
+    if not text:
+        return True
+
+    # Cheap gates first: loglines are long, end in an ellipsis, or span
+    # multiple sentences
+    if len(text) > 60:
+        return True
+    stripped = text.strip()
+    if stripped.endswith("…") or stripped.endswith("..."):
+        return True
+    if "…" in text or text.count(".") > 1:
+        return True
+
+    text_lower = text.lower()
+
+    # "A frisky, feminine, film noir about..." style openers
+    if _RE_LOGLINE_START.match(text_lower):
+        return True
+
+    # Descriptive phrases anywhere in the text, as one compiled pass
+    return _RE_LOGLINE_WORDS.search(text_lower) is not None
+
+
+@lru_cache(maxsize=4096)
+def _extract_runtime(text: str) -> Optional[int]:
+    """Extract runtime in minutes from text."""
+    # Match patterns like "2hrs 28mins", "1hr 52mins", "2h 30m", "1h 45m"
+    for pattern in (_RE_RUNTIME_FULL, _RE_RUNTIME_HOURS):
+        match = pattern.search(text)
+        if match:
+            hours = int(match.group(1))
+            mins = int(match.group(2)) if len(match.groups()) > 1 and match.group(2) else 0
+            return hours * 60 + mins
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _extract_year(text: str) -> Optional[int]:
+    """Extract release year from text."""
+    match = _RE_YEAR.search(text)
+    if match:
+        return int(match.group(1))
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _extract_director(text: str) -> Optional[str]:
+    """Extract director name from text."""
+    match = _RE_DIRECTED_BY.search(text)
+    if match:
+        return match.group(1).strip()
+    return None
+
 
 class CoolidgeScraper(BaseScraper):
     """Scraper for Coolidge Corner Theatre."""
@@ -25,16 +151,31 @@ class CoolidgeScraper(BaseScraper):
     base_url = "https://coolidge.org/"
     showtimes_url = "https://coolidge.org/films-events/now-playing"
     venue_name = "Coolidge Corner Theatre"
-    
+
+    # Cache for detail page data, shared across instances — the same film URL
+    # appears under many dates and across scrape runs (url -> (director, year))
+    _detail_cache: dict[str, tuple[Optional[str], Optional[int]]] = {}
+    _detail_cache_lock = threading.Lock()
+
     def __init__(self, config: ScraperConfig):
         super().__init__(config)
-        # Cache for detail page data (title -> (director, year))
-        self._detail_cache: dict[str, tuple[Optional[str], Optional[int]]] = {}
-        self._detail_cache_lock = threading.Lock()
-    
+        # Detail pages get a shorter timeout and a single retry; build the
+        # config once here rather than reflecting over fields on every fetch
+        self._detail_config = replace(
+            config,
+            timeout=min(config.timeout, 10),
+            max_retries=1,
+        )
+        # Refreshed at the top of scrape(); set here so the parsers also
+        # work when called directly
+        self._scrape_start = datetime.now()
+
     def scrape(self) -> list[Screening]:
         """Scrape all screenings from Coolidge by iterating through dates (in parallel)."""
         screenings = []
+        # One clock snapshot for the whole run; the past-screening filter in
+        # the parsers reads this instead of calling datetime.now() per time
+        self._scrape_start = datetime.now()
         dates = list(self.config.date_range())
         workers = min(MAX_DATE_WORKERS, len(dates)) or 1
 
@@ -49,14 +190,77 @@ class CoolidgeScraper(BaseScraper):
                 except Exception as e:
                     logger.warning(f"Coolidge scraping failed for {screening_date}: {e}")
 
+        self._backfill_detail_info(screenings)
+
         logger.info(f"Coolidge: Found {len(screenings)} total screenings")
         return screenings
+
+    def _backfill_detail_info(self, screenings: list[Screening]):
+        """Fill missing director/year from detail pages in one concurrent pass.
+
+        Fetching here instead of inside the parsers means detail requests
+        pipeline across the whole run rather than serializing within each
+        date worker, and each unique URL is fetched at most once.
+        """
+        pending: dict[str, list[Screening]] = {}
+        for s in screenings:
+            if (s.director is None and s.year is None
+                    and not s.source_url.startswith(self.showtimes_url)):
+                pending.setdefault(s.source_url, []).append(s)
+        if not pending:
+            return
+
+        workers = min(MAX_DATE_WORKERS, len(pending))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            future_to_url = {
+                executor.submit(self._get_detail_page_info, url, group[0].title): url
+                for url, group in pending.items()
+            }
+            for future in as_completed(future_to_url):
+                url = future_to_url[future]
+                director, year = future.result()
+                if director is None and year is None:
+                    continue
+                for s in pending[url]:
+                    s.director = director
+                    s.year = year
     
     def _scrape_date(self, screening_date: date) -> list[Screening]:
         """Scrape screenings for a specific date."""
         url = f"{self.showtimes_url}?date={screening_date.strftime('%Y-%m-%d')}"
-        soup = self.get_soup(url)
+        html = self.get_html(url)
+        if HTMLParser is not None:
+            screenings = self._parse_date_fast(html, screening_date)
+            if screenings is not None:
+                return screenings
+        soup = BeautifulSoup(html, "lxml", parse_only=_BODY_STRAINER)
         return self._parse_screenings(soup, screening_date)
+
+    def _parse_date_fast(self, html: bytes, screening_date: date) -> Optional[list[Screening]]:
+        """Parse a date page with selectolax, or None to defer to BeautifulSoup.
+
+        Defers when the page uses the card layout (film-section divs), which
+        the structural parser below handles; the common text-based path runs
+        entirely on the Lexbor tree.
+        """
+        tree = HTMLParser(html)
+        body = tree.body
+        if body is None:
+            return None
+        for node in tree.css("div[class]"):
+            if _RE_FILM_SECTION.search(node.attributes.get("class") or ""):
+                return None
+
+        title_to_url = {}
+        for link in tree.css("a[href]"):
+            link_text = link.text(deep=True, strip=True)
+            if link_text and len(link_text) >= 2 and not self._is_logline(link_text):
+                href = link.attributes.get("href")
+                if href:
+                    title_to_url[link_text] = self.make_absolute_url(href)
+
+        full_text = body.text(separator="\n", deep=True)
+        return self._parse_text_lines(_iter_lines(full_text), title_to_url, screening_date)
     
     def _parse_screenings(self, soup: BeautifulSoup, screening_date: date) -> list[Screening]:
         """Parse screenings from the Coolidge showtimes page."""
@@ -73,20 +277,21 @@ class CoolidgeScraper(BaseScraper):
         # The page structure has films with titles, runtimes, and time slots
         
         # Method 1: Look for elements with showtime links
-        film_sections = soup.find_all("div", class_=re.compile(r"film|movie|showtime|event", re.I))
-        
+        film_sections = soup.find_all("div", class_=_RE_FILM_SECTION)
+
         if not film_sections:
             # Method 2: Parse text-based structure
             return self._parse_text_based(soup, screening_date)
-        
+
         for section in film_sections:
             film_screenings = self._parse_film_section(section, screening_date)
             screenings.extend(film_screenings)
-        
-        # If no screenings found with div method, try text-based parsing
+
+        # Don't re-walk the whole body through the text parser when the card
+        # layout is present but empty; that usually just means no showtimes
         if not screenings:
-            screenings = self._parse_text_based(soup, screening_date)
-        
+            logger.debug(f"Coolidge {screening_date}: film sections present but no screenings parsed")
+
         return screenings
     
     def _parse_film_section(self, section: Tag, screening_date: date) -> list[Screening]:
@@ -140,31 +345,30 @@ class CoolidgeScraper(BaseScraper):
         if not title:
             return screenings
         
+        # Walk the section text once; get_text() is the expensive call here
+        text = section.get_text()
+
         # Extract runtime
-        runtime = self._extract_runtime(section.get_text())
-        
-        # Extract year and director from listing page first
-        year = self._extract_year(section.get_text())
-        director = self._extract_director(section.get_text())
-        
-        # Only fetch detail page if BOTH director and year are missing
-        # This avoids unnecessary requests when we already have partial info
-        if detail_url and not director and not year:
-            detail_director, detail_year = self._get_detail_page_info(detail_url, title)
-            director = detail_director
-            year = detail_year
-        
+        runtime = self._extract_runtime(text)
+
+        # Extract year and director from listing page; detail pages are
+        # backfilled in one concurrent pass at the end of scrape()
+        year = self._extract_year(text)
+        director = self._extract_director(text)
+
         # Extract showtimes - look for time patterns
-        text = section.get_text()
         times = self._extract_times(text)
         
         # Extract extra info and special attributes (35mm, special screenings, etc.)
         extra = self._extract_extra(text)
         special_attributes = extract_special_attributes(text) or None
         
-        # Create screening for each time
-        now = datetime.now()
+        # Create screening for each time, skipping past showtimes before
+        # allocating anything
+        now = self._scrape_start
         for time_obj in times:
+            if datetime.combine(screening_date, time_obj) <= now:
+                continue
             screening = Screening(
                 title=title,
                 venue=self.venue_name,
@@ -178,30 +382,38 @@ class CoolidgeScraper(BaseScraper):
                 extra=extra,
                 special_attributes=special_attributes,
             )
-            # Filter out screenings that have already passed
-            if screening.datetime_start > now:
-                screenings.append(screening)
-        
+            screenings.append(screening)
+
         return screenings
     
     def _parse_text_based(self, soup: BeautifulSoup, screening_date: date) -> list[Screening]:
         """Parse screenings using text-based extraction."""
-        screenings = []
-        
-        # Build a map of title -> detail URL by finding all links
+        # Build a map of title -> detail URL by finding all links. Most link
+        # titles are a single text node, so try the direct .string read
+        # before falling back to the subtree walk that get_text does.
         title_to_url = {}
         for link in soup.find_all("a", href=True):
-            link_text = link.get_text(strip=True)
+            link_text = link.string
+            link_text = link_text.strip() if link_text else link.get_text(strip=True)
             if link_text and len(link_text) >= 2 and not self._is_logline(link_text):
-                href = link.get("href", "")
+                href = link["href"]
                 if href:
                     title_to_url[link_text] = self.make_absolute_url(href)
-        
+
         # Get all text content
         body = soup.find("body") or soup
         full_text = body.get_text(separator="\n")
-        lines = [line.strip() for line in full_text.split("\n") if line.strip()]
-        
+        return self._parse_text_lines(_iter_lines(full_text), title_to_url, screening_date)
+
+    def _parse_text_lines(self, lines: Iterable[str], title_to_url: dict,
+                          screening_date: date) -> list[Screening]:
+        """Core line-oriented parse shared by the BS4 and selectolax paths.
+
+        ``lines`` may be any iterable; the parse is strictly sequential so a
+        generator works and avoids materializing the page's line list.
+        """
+        screenings = []
+
         current_title = None
         current_runtime = None
         current_year = None
@@ -211,105 +423,91 @@ class CoolidgeScraper(BaseScraper):
         prev_line_was_runtime = False
         pending_runtime_mins = False  # "2hrs" seen; next "29mins" adds to runtime
 
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-            runtime_match = hours_only = mins_only = None
+        for line in lines:
+            line_lower = line.lower()
+            time_match = None
+
+            # Single-character lines (bullets, separators) can't match any
+            # pattern below; they only clear the runtime-follows flag
+            if len(line) < 2:
+                prev_line_was_runtime = False
+                continue
 
-            # Skip navigation/header items
-            skip_patterns = [
-                "now playing", "coming soon", "calendar", "skip to", "main navigation",
-                "films & events", "education", "support us", "about us", "shop",
-                "become a member", "donate", "search", "home", "film guide",
-                "open captions", "membership", "gift cards",
-                "learn more", "new release", "cinema in 70mm", "spotlight on women",
-                "special screenings", "director in person", "speaker",
-            ]
             # Room/theater codes often appear after times (e.g. MH1, MH2, ECEC)
-            if re.match(r"^(MH\d|ECEC|MHB)$", line, re.I):
+            if line[0] in "MEme" and _RE_ROOM_CODE.match(line):
                 prev_line_was_runtime = False
                 pending_runtime_mins = False
-                i += 1
                 continue
-            if any(pattern in line.lower() for pattern in skip_patterns):
+            # Skip navigation/header items
+            if _RE_SKIP.search(line_lower):
                 prev_line_was_runtime = False
                 pending_runtime_mins = False
-                i += 1
                 continue
 
-            # Runtime: "2hrs 29mins" on one line, or "2hrs" then "29mins" on consecutive lines
-            runtime_match = re.search(r"(\d+)\s*h(?:rs?|ours?)?\s*(\d+)?\s*m(?:ins?)?", line, re.I)
-            if runtime_match:
-                hours = int(runtime_match.group(1))
-                mins = int(runtime_match.group(2)) if runtime_match.group(2) else 0
-                current_runtime = hours * 60 + mins
-                prev_line_was_runtime = True
-                pending_runtime_mins = False
-                i += 1
-                continue
-            mins_only = re.match(r"^(\d+)\s*m(?:ins?)?$", line, re.I)
-            if mins_only and pending_runtime_mins and current_runtime is not None:
-                current_runtime += int(mins_only.group(1))
-                pending_runtime_mins = False
-                prev_line_was_runtime = True
-                i += 1
-                continue
-            hours_only = re.match(r"^(\d+)\s*h(?:rs?|ours?)?$", line, re.I)
-            if hours_only:
-                current_runtime = int(hours_only.group(1)) * 60
-                pending_runtime_mins = True
-                prev_line_was_runtime = True
-                i += 1
-                continue
-            
-            # Check for time pattern (e.g., "3:00pm MH2", "7:00pm")
-            time_match = re.match(r"^(\d{1,2}:\d{2}\s*(?:am|pm))(?:\s*\w+)?$", line, re.I)
-            if time_match and current_title:
-                time_obj = parse_time(time_match.group(1))
-                if time_obj:
-                    # Only fetch detail page if BOTH director and year are missing
-                    director = current_director
-                    year = current_year
-                    if current_detail_url and not director and not year:
-                        detail_director, detail_year = self._get_detail_page_info(current_detail_url, current_title)
-                        director = detail_director
-                        year = detail_year
-                    
-                    special_attrs = extract_special_attributes(" ".join(current_extra)) if current_extra else None
-                    screening = Screening(
-                        title=current_title,
-                        venue=self.venue_name,
-                        date=screening_date,
-                        time=time_obj,
-                        source_url=current_detail_url or f"{self.showtimes_url}?date={screening_date.strftime('%Y-%m-%d')}",
-                        source_site="Coolidge",
-                        runtime_minutes=current_runtime,
-                        year=year,
-                        director=director,
-                        extra=", ".join(current_extra) if current_extra else None,
-                        special_attributes=special_attrs,
-                    )
-                    # Filter out screenings that have already passed
-                    now = datetime.now()
-                    if screening.datetime_start > now:
-                        screenings.append(screening)
-                prev_line_was_runtime = False
-                i += 1
-                continue
-            
-            # Check for year in metadata line
-            year_match = re.search(r"\b(19\d{2}|20\d{2})\b", line)
-            if year_match and not current_year:
-                current_year = int(year_match.group(1))
-            
+            # Runtimes, showtimes and years all contain a digit, so one cheap
+            # scan decides whether any of those patterns need to run at all;
+            # most lines (titles, names, loglines) are digit-free
+            has_digit = _RE_HAS_DIGIT.search(line) is not None
+            if has_digit:
+                # Runtime: "2hrs 29mins" on one line, or "2hrs" then "29mins" on consecutive lines
+                runtime_match = _RE_RUNTIME_FULL.search(line)
+                if runtime_match:
+                    hours = int(runtime_match.group(1))
+                    mins = int(runtime_match.group(2)) if runtime_match.group(2) else 0
+                    current_runtime = hours * 60 + mins
+                    prev_line_was_runtime = True
+                    pending_runtime_mins = False
+                    continue
+                mins_only = _RE_MINS_ONLY.match(line)
+                if mins_only and pending_runtime_mins and current_runtime is not None:
+                    current_runtime += int(mins_only.group(1))
+                    pending_runtime_mins = False
+                    prev_line_was_runtime = True
+                    continue
+                hours_only = _RE_HOURS_ONLY.match(line)
+                if hours_only:
+                    current_runtime = int(hours_only.group(1)) * 60
+                    pending_runtime_mins = True
+                    prev_line_was_runtime = True
+                    continue
+
+                # Check for time pattern (e.g., "3:00pm MH2", "7:00pm")
+                time_match = _RE_TIME_LINE.match(line)
+                if time_match and current_title:
+                    time_obj = parse_time(time_match.group(1))
+                    # Skip past showtimes before allocating a Screening
+                    if time_obj and datetime.combine(screening_date, time_obj) > self._scrape_start:
+                        # Detail pages are backfilled in scrape(), not fetched here
+                        special_attrs = extract_special_attributes(" ".join(current_extra)) if current_extra else None
+                        screenings.append(Screening(
+                            title=current_title,
+                            venue=self.venue_name,
+                            date=screening_date,
+                            time=time_obj,
+                            source_url=current_detail_url or f"{self.showtimes_url}?date={screening_date.strftime('%Y-%m-%d')}",
+                            source_site="Coolidge",
+                            runtime_minutes=current_runtime,
+                            year=current_year,
+                            director=current_director,
+                            extra=", ".join(current_extra) if current_extra else None,
+                            special_attributes=special_attrs,
+                        ))
+                    prev_line_was_runtime = False
+                    continue
+
+                # Check for year in metadata line
+                year_match = _RE_YEAR.search(line)
+                if year_match and not current_year:
+                    current_year = int(year_match.group(1))
+
             # Check for director (often appears as "Directed by X" or just a name after title)
-            director_match = re.search(r"Directed by\s+(.+?)(?:,|\s+\d{4}|$)", line, re.I)
+            director_match = _RE_DIRECTED_BY.search(line) if "irect" in line_lower else None
             if director_match and not current_director:
                 current_director = director_match.group(1).strip()
             # Also check for standalone director name (name without numbers, not too long, after title)
-            elif (current_title and not current_director and 
+            elif (current_title and not current_director and
                   len(line) > 2 and len(line) < 50 and
-                  not re.search(r"\d", line) and
+                  not has_digit and
                   not time_match and
                   not self._is_logline(line) and
                   line[0].isupper()):
@@ -317,9 +515,9 @@ class CoolidgeScraper(BaseScraper):
                 current_director = line
             
             # Check for special format markers
-            if "35mm" in line.lower():
+            if "35mm" in line_lower:
                 current_extra.append("35mm")
-            if "70mm" in line.lower():
+            if "70mm" in line_lower:
                 current_extra.append("70mm")
             
             # Check if this looks like a film title.
@@ -327,9 +525,9 @@ class CoolidgeScraper(BaseScraper):
             if prev_line_was_runtime:
                 prev_line_was_runtime = False
             elif (len(line) > 3 and len(line) < 100 and
-                  not re.search(r"\d:\d{2}", line) and
+                  not (has_digit and _RE_TIME_DIGITS.search(line)) and
                   line[0].isupper() and
-                  not any(skip in line.lower() for skip in skip_patterns) and
+                  not _RE_SKIP.search(line_lower) and
                   not self._is_logline(line)):
                 current_title = line
                 current_runtime = None
@@ -340,117 +538,50 @@ class CoolidgeScraper(BaseScraper):
                 current_extra = []
                 pending_runtime_mins = False
             
-            i += 1
-        
+
         return screenings
     
     def _is_logline(self, text: str) -> bool:
         """Check if text looks like a logline/description rather than a title."""
-        if not text:
-            return True
-        
-        text_lower = text.lower()
-        
-        # Loglines often start with "A" or "An" followed by an adjective
-        # Pattern matches: "A frisky, feminine, film noir about..." or "A film about..."
-        if re.match(r"^a\s+[a-z]+(?:,\s+[a-z]+)*(?:\s+film\s+noir)?\s+(?:film|movie|story|tale|about)", text_lower):
-            return True
-        if re.match(r"^an\s+[a-z]+(?:\s+film\s+noir)?\s+(?:film|movie|story|tale|about)", text_lower):
-            return True
-        
-        # Loglines often contain descriptive phrases
-        logline_indicators = [
-            "about",
-            "frisky",
-            "feminine",
-            "film noir",
-            "tells the story",
-            "follows",
-            "explores",
-            "chronicles",
-            "depicts",
-            "portrays",
-            "many other things",
-        ]
-        if any(indicator in text_lower for indicator in logline_indicators):
-            return True
-        
-        # Loglines often end with ellipsis
-        if text.strip().endswith("…") or text.strip().endswith("..."):
-            return True
-        
-        # Loglines are typically longer than titles (more than 60 chars)
-        if len(text) > 60:
-            return True
-        
-        # Titles are usually shorter and don't contain multiple sentences
-        if text.count(".") > 1 or text.count("…") > 0:
-            return True
-        
-        return False
+        return _is_logline(text)
     
     def _extract_runtime(self, text: str) -> Optional[int]:
         """Extract runtime in minutes from text."""
-        # Match patterns like "2hrs 28mins", "1hr 52mins", "2h 30m", "1h 45m"
-        patterns = [
-            r"(\d+)\s*h(?:rs?|ours?)?\s*(\d+)?\s*m(?:ins?)?",
-            r"(\d+)\s*h(?:rs?|ours?)?",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, text, re.I)
-            if match:
-                hours = int(match.group(1))
-                mins = int(match.group(2)) if len(match.groups()) > 1 and match.group(2) else 0
-                return hours * 60 + mins
-        return None
+        return _extract_runtime(text)
     
     def _extract_year(self, text: str) -> Optional[int]:
         """Extract release year from text."""
-        match = re.search(r"\b(19\d{2}|20\d{2})\b", text)
-        if match:
-            return int(match.group(1))
-        return None
+        return _extract_year(text)
     
     def _extract_director(self, text: str) -> Optional[str]:
         """Extract director name from text."""
-        # Look for "Directed by X" pattern
-        match = re.search(r"Directed by\s+(.+?)(?:,|\s+\d{4}|$)", text, re.I)
-        if match:
-            return match.group(1).strip()
-        return None
+        return _extract_director(text)
     
     def _get_detail_page_info(self, detail_url: str, title: str) -> tuple[Optional[str], Optional[int]]:
         """Fetch director and year from a movie's detail page.
         
         Args:
             detail_url: URL of the movie detail page
-            title: Movie title (for caching)
-            
+            title: Movie title (for logging)
+
         Returns:
             Tuple of (director, year) or (None, None) if not found
         """
-        cache_key = f"{title}|{detail_url}"
-        with self._detail_cache_lock:
-            if cache_key in self._detail_cache:
-                return self._detail_cache[cache_key]
+        # The URL alone identifies the film; keying on it dedups fetches of
+        # the same title across dates. Reads are lock-free — dict lookups are
+        # atomic under the GIL, the lock is only needed for the insert.
+        cache_key = detail_url
+        cached = self._detail_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         director = None
         year = None
 
         try:
-            # Use a shorter timeout for detail pages to avoid hanging
-            # Create a config copy with shorter timeout
-            from dataclasses import replace
-            detail_config = replace(
-                self.config,
-                timeout=min(self.config.timeout, 10),  # Max 10 seconds for detail pages
-                max_retries=1  # Only retry once for detail pages
-            )
-            
-            # Fetch with shorter timeout
-            from .base import fetch_with_retry
-            response = fetch_with_retry(detail_url, detail_config)
-            soup = BeautifulSoup(response.content, "lxml")
+            # Fetch with the shorter detail-page timeout (built in __init__)
+            response = fetch_with_retry(detail_url, self._detail_config)
+            soup = BeautifulSoup(response.content, "lxml", parse_only=_BODY_STRAINER)
             page_text = soup.get_text()
             
             # Extract director
@@ -460,12 +591,12 @@ class CoolidgeScraper(BaseScraper):
             year = self._extract_year(page_text)
 
             with self._detail_cache_lock:
-                self._detail_cache[cache_key] = (director, year)
+                self._detail_cache.setdefault(cache_key, (director, year))
 
         except Exception as e:
             logger.debug(f"Coolidge: Could not fetch detail page {detail_url}: {e}")
             with self._detail_cache_lock:
-                self._detail_cache[cache_key] = (None, None)
+                self._detail_cache.setdefault(cache_key, (None, None))
 
         return director, year
     
@@ -474,8 +605,7 @@ class CoolidgeScraper(BaseScraper):
         times = []
         
         # Match times like "3:00pm", "7:00 PM"
-        time_pattern = r"(\d{1,2}:\d{2}\s*(?:am|pm))"
-        matches = re.findall(time_pattern, text, re.I)
+        matches = _RE_TIME_ANY.findall(text)
         
         for match in matches:
             time_obj = parse_time(match)
@@ -1,17 +1,55 @@
 """Scraper for Harvard Film Archive (harvardfilmarchive.org)."""
 
+import json
 import logging
 import re
-from datetime import datetime, date
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, date, timedelta
+from pathlib import Path
 from typing import Optional, List, Dict, Any
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from ..models import Screening, ScraperConfig
 from .base import BaseScraper, parse_time, extract_special_attributes
 
+# Optional fast path: detail pages only need their body text, which
+# selectolax (Lexbor) extracts without building a BeautifulSoup tree
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
+
 logger = logging.getLogger(__name__)
 
+# Detail pages are only mined for text; skip building the <head>
+_BODY_STRAINER = SoupStrainer("body")
+
+# Precompiled patterns for the per-spot calendar parse and detail pages;
+# these run for every spot on every page
+_DAY_HEADER_RE = re.compile(r"([a-zA-Z]+)\s*(\d{1,2})\s*([a-zA-Z]+)", re.I)
+_TIME_RE = re.compile(r"\d{1,2}:\d{2}\s*(?:am|pm)", re.I)
+_DIRECTED_RE = re.compile(r"Directed by\s+(.+?),\s*(\d{4})\s*$")
+# Both runtime notations in one alternation so the (multi-KB) detail text
+# is scanned once; dispatch on which named group filled in
+_RUNTIME_RE = re.compile(
+    r"\b(?:(?P<mins>\d{1,3})\s*min\.?|(?P<h>\d+)\s*h\s*(?P<m>\d+)?\s*m\.?)\b",
+    re.I,
+)
+_VIEW_MORE_RE = re.compile(r"view\s*more", re.I)
+_PAGE_HREF_RE = re.compile(r"page=\d+")
+
+# Max concurrent detail-page requests (avoids hammering the server)
+MAX_DETAIL_WORKERS = 8
+
+# A film's runtime and format never change, so detail-page results are kept
+# across runs far longer than the page cache itself
+DETAIL_CACHE_TTL_SECONDS = 30 * 24 * 3600
+
+# A concrete gauge supersedes the generic "Screening on film" attribute
+_FILM_FORMATS = frozenset({"35mm", "16mm", "70mm"})
+
 # Day and month names for date parsing
 DAYS = {"monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"}
 MONTH_NAMES = (
@@ -44,8 +82,7 @@ class HarvardFilmArchiveScraper(BaseScraper):
     def scrape(self) -> list[Screening]:
         """Scrape all screenings from HFA using date range and pagination."""
         screenings = []
-        self._runtime_cache: Dict[str, Optional[int]] = {}
-        self._detail_attrs_cache: Dict[str, List[str]] = {}
+        self._load_detail_cache()
 
         try:
             start_str = self.config.start_date.strftime("%Y-%m-%d")
@@ -58,25 +95,39 @@ class HarvardFilmArchiveScraper(BaseScraper):
                 if page > 1:
                     url += f"&page={page}"
 
-                soup = self.get_soup(url)
-                page_events = self._parse_calendar_page(soup, year)
-
-                if not page_events and page == 1:
+                html = self.get_html(url)
+                page_events = None
+                if HTMLParser is not None:
+                    tree = HTMLParser(html)
+                    if tree.body is not None:
+                        page_events = self._parse_calendar_page_fast(tree, year)
+                        has_more = self._has_more_pages_fast(tree)
+                if page_events is None:
+                    soup = BeautifulSoup(html, "lxml")
+                    page_events = self._parse_calendar_page(soup, year)
+                    has_more = self._has_more_pages(soup)
+
+                # The parse already drops out-of-range days, so an empty
+                # first page only signals a broken layout when there is no
+                # pagination to follow either
+                if not page_events and page == 1 and not has_more:
                     break
 
+                # Warm the detail caches concurrently so the assembly loop
+                # below hits the cache instead of serializing HTTP requests
+                detail_info = self._prefetch_detail_info(page_events)
+
                 for ev in page_events:
-                    if not (self.config.start_date <= ev["date"] <= self.config.end_date):
-                        continue
                     detail_url = ev.get("detail_url")
                     runtime = None
                     special_attributes = list(ev.get("special_attributes") or [])
                     if detail_url:
-                        runtime, detail_attrs = self._get_runtime_and_attrs_for_detail_url(detail_url)
+                        runtime, detail_attrs = detail_info.get(detail_url, (None, []))
                         if detail_attrs:
-                            for a in detail_attrs:
-                                if a not in special_attributes:
-                                    special_attributes.append(a)
-                            if any(x in special_attributes for x in ("35mm", "16mm", "70mm")):
+                            # dict.fromkeys dedups in one pass while keeping
+                            # calendar-page attrs ahead of detail-page ones
+                            special_attributes = list(dict.fromkeys((*special_attributes, *detail_attrs)))
+                            if _FILM_FORMATS.intersection(special_attributes):
                                 special_attributes = [a for a in special_attributes if a != "Screening on film"]
                     screenings.append(Screening(
                         title=ev["title"],
@@ -94,7 +145,7 @@ class HarvardFilmArchiveScraper(BaseScraper):
 
                 logger.debug(f"HFA page {page}: Found {len(page_events)} events")
 
-                if not self._has_more_pages(soup):
+                if not has_more:
                     break
 
                 page += 1
@@ -106,87 +157,291 @@ class HarvardFilmArchiveScraper(BaseScraper):
 
         except Exception as e:
             logger.error(f"Harvard Film Archive scraping failed: {e}")
-            import traceback
             logger.debug(traceback.format_exc())
 
+        self._save_detail_cache()
         return screenings
 
+    def _detail_cache_path(self) -> Path:
+        return self._cache_dir / "detail_info.json"
+
+    def _load_detail_cache(self):
+        """Seed the in-memory detail caches from the on-disk store.
+
+        Scheduled runs mostly see the same films as the previous run, so
+        warm entries skip the detail fetch entirely.
+        """
+        self._runtime_cache: Dict[str, Optional[int]] = {}
+        self._detail_attrs_cache: Dict[str, List[str]] = {}
+        self._detail_fetched_at: Dict[str, str] = {}
+        if not self.config.use_cache:
+            return
+        try:
+            entries = json.loads(self._detail_cache_path().read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return
+        cutoff = datetime.now() - timedelta(seconds=DETAIL_CACHE_TTL_SECONDS)
+        for url, entry in entries.items():
+            try:
+                fetched_at = datetime.fromisoformat(entry["fetched_at"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            if fetched_at < cutoff:
+                continue
+            self._runtime_cache[url] = entry.get("runtime")
+            self._detail_attrs_cache[url] = entry.get("attrs") or []
+            self._detail_fetched_at[url] = entry["fetched_at"]
+
+    def _save_detail_cache(self):
+        """Persist the detail caches, keeping original fetch timestamps."""
+        if not self.config.use_cache:
+            return
+        now_iso = datetime.now().isoformat()
+        entries = {
+            url: {
+                "runtime": runtime,
+                "attrs": self._detail_attrs_cache.get(url, []),
+                "fetched_at": self._detail_fetched_at.get(url, now_iso),
+            }
+            for url, runtime in self._runtime_cache.items()
+        }
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            self._detail_cache_path().write_text(json.dumps(entries), encoding="utf-8")
+        except OSError as e:
+            logger.debug("HFA: Could not persist detail cache: %s", e)
+
+    def _prefetch_detail_info(
+        self, events: List[Dict[str, Any]]
+    ) -> Dict[str, tuple[Optional[int], List[str]]]:
+        """Resolve detail info for these events' unique URLs, in parallel.
+
+        Detail fetches are I/O-bound, so overlapping them cuts the per-page
+        cost from a sum of RTTs to roughly the slowest one. The caches are
+        plain dicts; writes are atomic under the GIL and each URL is
+        submitted once. Returns url -> (runtime, attrs) so the assembly loop
+        fans results back out to events with a single dict lookup.
+        """
+        unique_urls = {ev["detail_url"] for ev in events if ev.get("detail_url")}
+        pending = unique_urls - self._runtime_cache.keys()
+
+        if pending:
+            workers = min(MAX_DETAIL_WORKERS, len(pending))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(self._get_runtime_and_attrs_for_detail_url, url)
+                    for url in pending
+                ]
+                for future in as_completed(futures):
+                    future.result()  # errors are handled inside the fetch
+
+        return {
+            url: self._get_runtime_and_attrs_for_detail_url(url)
+            for url in unique_urls
+        }
+
     def _has_more_pages(self, soup: BeautifulSoup) -> bool:
-        view_more = soup.find("a", string=re.compile(r"view\s*more", re.I))
+        view_more = soup.find("a", string=_VIEW_MORE_RE)
         if view_more:
             return True
-        return bool(soup.find("a", href=re.compile(r"page=\d+")))
+        return bool(soup.find("a", href=_PAGE_HREF_RE))
+
+    def _has_more_pages_fast(self, tree: "HTMLParser") -> bool:
+        for a in tree.css("a"):
+            if _PAGE_HREF_RE.search(a.attributes.get("href") or ""):
+                return True
+            if _VIEW_MORE_RE.search(a.text(deep=True, strip=True) or ""):
+                return True
+        return False
+
+    def _parse_calendar_page_fast(self, tree: "HTMLParser", year: int) -> list[Dict[str, Any]]:
+        """Parse the HFA calendar on the selectolax (Lexbor) tree.
+
+        Mirrors ``_parse_calendar_page`` field for field; queries run in the
+        C engine instead of per-node Python calls.
+        """
+        events: List[Dict[str, Any]] = []
+        current_date: Optional[date] = None
+        today_month = date.today().month  # one clock read for the rollover checks
+
+        for s in tree.css('[class*="m-calendar__spot"]'):
+            classes = s.attributes.get("class") or ""
+
+            if "m-calendar__spot--day" in classes:
+                text = s.text(deep=True).strip()
+                mobj = _DAY_HEADER_RE.search(text)
+                if mobj:
+                    day_name, num_str, month_str = mobj.group(1), mobj.group(2), mobj.group(3)
+                    if day_name.lower() in DAYS and num_str.isdigit() and month_str.lower() in MONTH_TO_NUM:
+                        try:
+                            d, m = int(num_str), MONTH_TO_NUM[month_str.lower()]
+                            current_date = date(year, m, d)
+                            if current_date.month < today_month - 6:
+                                current_date = current_date.replace(year=year + 1)
+                        except (ValueError, KeyError):
+                            pass
+                continue
+
+            if "m-calendar__spot--event" not in classes or current_date is None:
+                continue
+
+            # Out-of-range days cost nothing beyond the date check; calendar
+            # pages often span weeks past the configured window
+            if not (self.config.start_date <= current_date <= self.config.end_date):
+                continue
+
+            detail_url = None
+            for a in s.css("a"):
+                h = a.attributes.get("href") or ""
+                if h and "/calendar/" in h and "programs" not in h and "page=" not in h:
+                    detail_url = self.make_absolute_url(h)
+                    break
+
+            spot_text = s.text(deep=True)
+
+            time_node = s.css_first("time")
+            if time_node is not None:
+                time_str = time_node.text(deep=True).strip()
+            else:
+                time_str = spot_text
+            t_match = _TIME_RE.search(time_str)
+            t = parse_time(t_match.group(0)) if t_match else None
+            if not t:
+                continue
+
+            title_node = s.css_first("h5") or s.css_first("h4") or s.css_first("h3")
+            title = title_node.text(deep=True).strip() if title_node is not None else None
+            if not title:
+                continue
+
+            director, release_year, series = None, None, None
+            for div in s.css("div"):
+                if director is not None and series is not None:
+                    break
+                # css() on a div node matches the node itself; the spot's own
+                # text is the whole card, not a director/series line
+                if "m-calendar__spot" in (div.attributes.get("class") or ""):
+                    continue
+                txt = div.text(deep=True).strip()
+                if director is None:
+                    dm = _DIRECTED_RE.match(txt)
+                    if dm:
+                        director = dm.group(1).strip()
+                        try:
+                            release_year = int(dm.group(2))
+                        except ValueError:
+                            pass
+                if series is None and ("From the" in txt or "..." in txt):
+                    series = txt
+
+            special_attributes = extract_special_attributes(spot_text) or None
+
+            events.append({
+                "date": current_date,
+                "time": t,
+                "title": title,
+                "director": director,
+                "year": release_year,
+                "series": series,
+                "detail_url": detail_url,
+                "special_attributes": special_attributes,
+            })
+
+        return events
 
     def _parse_calendar_page(self, soup: BeautifulSoup, year: int) -> list[Dict[str, Any]]:
         """Parse HFA calendar via DOM. Returns list of dicts with date, time, title, director, year, series, detail_url."""
         events: List[Dict[str, Any]] = []
-        spots = soup.find_all(class_=lambda c: c and "m-calendar__spot" in str(c))
+        # CSS substring selector stays inside SoupSieve's compiled matcher
+        # instead of invoking a Python lambda for every element on the page
+        spots = soup.select('[class*="m-calendar__spot"]')
         current_date: Optional[date] = None
+        today_month = date.today().month  # one clock read for the rollover checks
 
         for s in spots:
+            # Membership on the parsed class list; no joined-string rebuild
             classes = s.get("class") or []
-            cstr = " ".join(classes)
 
-            if "m-calendar__spot--day" in cstr:
+            if "m-calendar__spot--day" in classes:
                 text = (s.get_text() or "").strip()
                 # "Friday30January" or "Saturday31January" – day/month letters only to avoid \w matching digits
-                mobj = re.search(r"([a-zA-Z]+)\s*(\d{1,2})\s*([a-zA-Z]+)", text, re.I)
+                mobj = _DAY_HEADER_RE.search(text)
                 if mobj:
                     day_name, num_str, month_str = mobj.group(1), mobj.group(2), mobj.group(3)
                     if day_name.lower() in DAYS and num_str.isdigit() and month_str.lower() in MONTH_TO_NUM:
                         try:
                             d, m = int(num_str), MONTH_TO_NUM[month_str.lower()]
                             current_date = date(year, m, d)
-                            if current_date.month < date.today().month - 6:
+                            if current_date.month < today_month - 6:
                                 current_date = current_date.replace(year=year + 1)
                         except (ValueError, KeyError):
                             pass
                 continue
 
-            if "m-calendar__spot--event" not in cstr or current_date is None:
+            if "m-calendar__spot--event" not in classes or current_date is None:
                 continue
 
-            link = s.find("a", href=lambda h: h and "/calendar/" in str(h) and "programs" not in str(h) and "page=" not in str(h))
-            detail_url = self.make_absolute_url(link["href"]) if link and link.get("href") else None
+            # Out-of-range days cost nothing beyond the date check; calendar
+            # pages often span weeks past the configured window
+            if not (self.config.start_date <= current_date <= self.config.end_date):
+                continue
 
-            time_el = s.find("time") or s.find(string=re.compile(r"\d{1,2}:\d{2}\s*(?:am|pm)", re.I))
-            if time_el is None:
-                time_str = ""
-            elif hasattr(time_el, "get_text"):
-                time_str = (time_el.get_text() or "").strip()
+            # One walk over the spot's subtree instead of a find/find_all per
+            # field; each of those was a full traversal of the same nodes
+            link = None
+            time_tag = None
+            time_text = None
+            headings: Dict[str, Any] = {}
+            director, release_year, series = None, None, None
+            text_parts: List[str] = []
+            for el in s.descendants:
+                name = getattr(el, "name", None)
+                if name is None:
+                    text_parts.append(str(el))
+                    if time_text is None and _TIME_RE.search(str(el)):
+                        time_text = str(el).strip()
+                    continue
+                if name == "a" and link is None:
+                    h = el.get("href") or ""
+                    if h and "/calendar/" in h and "programs" not in h and "page=" not in h:
+                        link = el
+                elif name == "time" and time_tag is None:
+                    time_tag = el
+                elif name in ("h3", "h4", "h5") and name not in headings:
+                    headings[name] = el
+                elif name == "div" and (director is None or series is None):
+                    txt = (el.get_text() or "").strip()
+                    if director is None:
+                        dm = _DIRECTED_RE.match(txt)
+                        if dm:
+                            director = dm.group(1).strip()
+                            try:
+                                release_year = int(dm.group(2))
+                            except ValueError:
+                                pass
+                    if series is None and ("From the" in txt or "..." in txt):
+                        series = txt
+
+            detail_url = self.make_absolute_url(link["href"]) if link else None
+
+            if time_tag is not None:
+                time_str = (time_tag.get_text() or "").strip()
             else:
-                time_str = str(time_el).strip()
-            t_match = re.search(r"\d{1,2}:\d{2}\s*(?:am|pm)", time_str, re.I)
+                time_str = time_text or ""
+            t_match = _TIME_RE.search(time_str)
             t = parse_time(t_match.group(0)) if t_match else None
             if not t:
                 continue
 
-            title_el = s.find("h5") or s.find("h4") or s.find("h3")
+            title_el = headings.get("h5") or headings.get("h4") or headings.get("h3")
             title = (title_el.get_text() or "").strip() if title_el else None
             if not title:
                 continue
 
-            director, release_year = None, None
-            for div in s.find_all("div"):
-                txt = (div.get_text() or "").strip()
-                dm = re.match(r"Directed by\s+(.+?),\s*(\d{4})\s*$", txt)
-                if dm:
-                    director = dm.group(1).strip()
-                    try:
-                        release_year = int(dm.group(2))
-                    except ValueError:
-                        pass
-                    break
-
-            series = None
-            for div in s.find_all("div"):
-                txt = (div.get_text() or "").strip()
-                if "From the" in txt or "..." in txt:
-                    series = txt
-                    break
-
-            # Extract special attributes from this event's text (screening on film, panel discussion, etc.)
-            spot_text = (s.get_text() or "").strip()
+            # Extract special attributes from this event's text (screening on
+            # film, panel discussion, etc.); the strings were already gathered
+            # in the walk above, so no second subtree traversal
+            spot_text = "".join(text_parts).strip()
             special_attributes = extract_special_attributes(spot_text) or None
 
             events.append({
@@ -211,10 +466,8 @@ class HarvardFilmArchiveScraper(BaseScraper):
         runtime = None
         attrs: List[str] = []
         try:
-            soup = self.get_soup(detail_url)
-            body = soup.find("body") or soup
-            text = (body.get_text() or "").replace("\n", " ")
-            runtime = self._extract_runtime_from_detail_page(soup)
+            text = self._get_detail_page_text(detail_url)
+            runtime = self._extract_runtime_from_detail_page(text)
             attrs = extract_special_attributes(text)
         except Exception as e:
             logger.debug("HFA: Could not fetch detail from %s: %s", detail_url, e)
@@ -222,18 +475,30 @@ class HarvardFilmArchiveScraper(BaseScraper):
         self._detail_attrs_cache[detail_url] = attrs
         return (runtime, attrs)
 
-    def _extract_runtime_from_detail_page(self, soup: BeautifulSoup) -> Optional[int]:
+    def _get_detail_page_text(self, detail_url: str) -> str:
+        """Fetch a detail page and return its body text in one pass."""
+        html = self.get_html(detail_url)
+        if HTMLParser is not None:
+            body = HTMLParser(html).body
+            text = body.text(separator=" ", deep=True) if body is not None else ""
+        else:
+            soup = BeautifulSoup(html, "lxml", parse_only=_BODY_STRAINER)
+            body = soup.find("body") or soup
+            text = body.get_text(separator=" ") or ""
+        return text.replace("\n", " ")
+
+    def _extract_runtime_from_detail_page(self, text: str) -> Optional[int]:
         """Parse runtime from detail page blurb: '... country, year, format, color, 111 min.' or '111min.'."""
-        body = soup.find("body") or soup
-        text = (body.get_text() or "").replace("\n", " ")
-        m = re.search(r"\b(\d{1,3})\s*min\.?\b", text, re.I)
-        if m:
-            val = int(m.group(1))
-            if 1 <= val <= 600:
-                return val
-        m = re.search(r"\b(\d+)\s*h\s*(\d+)?\s*m\.?\b", text, re.I)
-        if m:
-            h, mn = int(m.group(1)), int(m.group(2)) if m.group(2) else 0
-            if 0 <= h <= 24 and 0 <= mn < 60:
-                return h * 60 + mn
-        return None
+        # A plausible "N min" anywhere wins over an hours/minutes form, as
+        # before; the fused pattern just finds both in one pass
+        hm_runtime = None
+        for m in _RUNTIME_RE.finditer(text):
+            if m.group("mins") is not None:
+                val = int(m.group("mins"))
+                if 1 <= val <= 600:
+                    return val
+            elif hm_runtime is None:
+                h, mn = int(m.group("h")), int(m.group("m") or 0)
+                if 0 <= h <= 24 and 0 <= mn < 60:
+                    hm_runtime = h * 60 + mn
+        return hm_runtime
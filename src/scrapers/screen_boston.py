@@ -2,7 +2,9 @@
 
 import logging
 import re
+import traceback
 from datetime import datetime, date
+from functools import lru_cache
 from typing import Optional, List
 
 from bs4 import BeautifulSoup, Tag
@@ -12,6 +14,82 @@ from .base import BaseScraper, parse_time, parse_runtime, parse_date_header, ext
 
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns for the per-line film-block parse; these run up to
+# 15 times per candidate block across every line on the page. The three
+# anchored line shapes (showtime, year/genre/runtime metadata, bare year)
+# are mutually exclusive, so one alternation classifies a line in a single
+# match and the parser dispatches on which named group filled in.
+_BLOCK_LINE_RE = re.compile(
+    r"^(?:(?P<time>\d{1,2}:\d{2}\s*(?:AM|PM))$"
+    r"|(?P<meta_year>19\d{2}|20\d{2}),\s*\w+,\s*(?P<meta_runtime>\d+h\s*\d*m?)"
+    r"|(?P<year>19\d{2}|20\d{2})$)",
+    re.IGNORECASE,
+)
+_HAS_DIGIT_RE = re.compile(r"\d")
+_RUNTIME_RE = re.compile(r"(\d+)h\s*(\d*)m?")
+
+# Section headers that never belong to a film block
+_HEADER_LINES = frozenset({"now screening", "upcoming screenings", "schedule", "about"})
+
+# Special-event markers as one alternation instead of six substring scans
+_SPECIAL_MARKERS = (
+    "in person", "q&a", "discussion", "seminar", "live score", "sing-along",
+)
+_SPECIAL_MARKER_RE = re.compile("|".join(re.escape(m) for m in _SPECIAL_MARKERS))
+
+# Day/month vocabularies as single alternations instead of 19 substring scans
+_DAY_RE = re.compile(r"monday|tuesday|wednesday|thursday|friday|saturday|sunday")
+_MONTH_RE = re.compile(
+    r"january|february|march|april|may|june"
+    r"|july|august|september|october|november|december"
+)
+
+# Venue name mappings (canonical name -> aliases seen on the page)
+_VENUES = {
+    "The Brattle": ["brattle", "the brattle"],
+    "Coolidge Corner Theatre": ["coolidge", "coolidge corner"],
+    "Harvard Film Archive": ["harvard film archive", "hfa"],
+    "Somerville Theatre": ["somerville theatre", "somerville theater"],
+    "West Newton Cinema": ["west newton"],
+    "Museum of Fine Arts": ["museum of fine arts", "mfa", "museum of fine art"],
+    "Capitol Theatre": ["capitol theatre", "capitol theater"],
+}
+# Anchored alternation over all aliases; an anchored match consumes exactly
+# one alias, so the matched text maps straight back to its canonical name.
+# Alternatives keep declaration order so the first alias wins, as before.
+_VENUE_TO_NAME = {alias: name for name, aliases in _VENUES.items() for alias in aliases}
+_VENUE_RE = re.compile("|".join(re.escape(alias) for alias in _VENUE_TO_NAME))
+
+
+# The same short lines (venue names, date headers, showtimes) recur all over
+# the page and the look-ahead windows overlap, so memoize the classifiers
+@lru_cache(maxsize=4096)
+def _is_date_header(text: str) -> bool:
+    """Check if text looks like a date header."""
+    # Date headers are short
+    if len(text) >= 50:
+        return False
+    text_lower = text.lower()
+    return _DAY_RE.search(text_lower) is not None and _MONTH_RE.search(text_lower) is not None
+
+
+@lru_cache(maxsize=4096)
+def _extract_venue(text: str) -> Optional[str]:
+    """Extract venue name from text."""
+    match = _VENUE_RE.match(text.lower().strip())
+    return _VENUE_TO_NAME[match.group(0)] if match else None
+
+
+@lru_cache(maxsize=512)
+def _parse_runtime_str(runtime_str: str) -> Optional[int]:
+    """Parse a runtime string like '1h 59m' into minutes."""
+    match = _RUNTIME_RE.search(runtime_str)
+    if match:
+        hours = int(match.group(1))
+        minutes = int(match.group(2)) if match.group(2) else 0
+        return hours * 60 + minutes
+    return None
+
 
 class ScreenBostonScraper(BaseScraper):
     """Scraper for Screen Boston - aggregates screenings from multiple Boston theaters."""
@@ -20,15 +98,7 @@ class ScreenBostonScraper(BaseScraper):
     base_url = "https://screenboston.com/"
     
     # Venue name mappings
-    VENUES = {
-        "The Brattle": ["brattle", "the brattle"],
-        "Coolidge Corner Theatre": ["coolidge", "coolidge corner"],
-        "Harvard Film Archive": ["harvard film archive", "hfa"],
-        "Somerville Theatre": ["somerville theatre", "somerville theater"],
-        "West Newton Cinema": ["west newton"],
-        "Museum of Fine Arts": ["museum of fine arts", "mfa", "museum of fine art"],
-        "Capitol Theatre": ["capitol theatre", "capitol theater"],
-    }
+    VENUES = _VENUES
     
     def scrape(self) -> list[Screening]:
         """Scrape all screenings from Screen Boston."""
@@ -40,7 +110,6 @@ class ScreenBostonScraper(BaseScraper):
             logger.info(f"Screen Boston: Found {len(screenings)} screenings")
         except Exception as e:
             logger.error(f"Screen Boston scraping failed: {e}")
-            import traceback
             logger.debug(traceback.format_exc())
         
         return screenings
@@ -54,7 +123,9 @@ class ScreenBostonScraper(BaseScraper):
         """
         screenings = []
         current_date = None
-        current_year = datetime.now().year
+        now = datetime.now()
+        current_year = now.year
+        today_month = now.month  # one clock read for the rollover checks
         
         # Get all text content and split by date headers
         # Screen Boston uses a simple structure with date headers followed by film info
@@ -74,8 +145,7 @@ class ScreenBostonScraper(BaseScraper):
                 if parsed_date:
                     current_date = parsed_date
                     # Handle year rollover
-                    today = datetime.now().date()
-                    if current_date.month < today.month - 6:
+                    if current_date.month < today_month - 6:
                         current_date = current_date.replace(year=current_year + 1)
                 i += 1
                 continue
@@ -109,16 +179,7 @@ class ScreenBostonScraper(BaseScraper):
     
     def _is_date_header(self, text: str) -> bool:
         """Check if text looks like a date header."""
-        days = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
-        months = ["january", "february", "march", "april", "may", "june", 
-                  "july", "august", "september", "october", "november", "december"]
-        
-        text_lower = text.lower()
-        has_day = any(day in text_lower for day in days)
-        has_month = any(month in text_lower for month in months)
-        
-        # Also check it's not too long (date headers are short)
-        return has_day and has_month and len(text) < 50
+        return _is_date_header(text)
     
     def _parse_screen_boston_date(self, text: str, year: int) -> Optional[date]:
         """Parse a Screen Boston date header."""
@@ -172,61 +233,63 @@ class ScreenBostonScraper(BaseScraper):
                 break
             
             line = lines[start_idx + offset]
-            
+            line_lower = line.lower()
+
             # Stop if we hit another date header
             if self._is_date_header(line):
                 break
-            
+
             # Skip "Now Screening" and similar headers
-            if line.lower() in ["now screening", "upcoming screenings", "schedule", "about"]:
+            if line_lower in _HEADER_LINES:
                 consumed = offset + 1
                 continue
-            
+
             # Skip "SCREEN BOSTON CO-PRESENTS" prefix
-            if "SCREEN BOSTON" in line.upper():
+            if "screen boston" in line_lower:
                 consumed = offset + 1
                 continue
             
+            # Classify the line's shape once; the named groups are mutually
+            # exclusive so each branch just checks which one filled in
+            line_match = _BLOCK_LINE_RE.match(line)
+            time_match = line_match.group("time") if line_match else None
+
             # Check for time (indicates we're in a film block)
-            time_match = re.match(r"^(\d{1,2}:\d{2}\s*(?:AM|PM))$", line, re.IGNORECASE)
             if time_match:
-                time_obj = parse_time(time_match.group(1))
+                time_obj = parse_time(time_match)
                 if time_obj:
                     times.append(time_obj)
                 consumed = offset + 1
                 continue
-            
+
             # Check for venue
             detected_venue = self._extract_venue(line)
             if detected_venue and venue is None:
                 venue = detected_venue
                 consumed = offset + 1
                 continue
-            
+
             # Check for year/genre/runtime line (e.g., "2025, Drama, 1h 59m")
-            metadata_match = re.match(r"^(19\d{2}|20\d{2}),\s*\w+,\s*(\d+h\s*\d*m?)", line)
-            if metadata_match:
-                year = int(metadata_match.group(1))
-                runtime = self._parse_runtime_str(metadata_match.group(2))
+            if line_match and line_match.group("meta_runtime"):
+                year = int(line_match.group("meta_year"))
+                runtime = self._parse_runtime_str(line_match.group("meta_runtime"))
                 consumed = offset + 1
                 continue
-            
+
             # Check for standalone year line
-            year_match = re.match(r"^(19\d{2}|20\d{2})$", line)
-            if year_match and year is None:
-                year = int(year_match.group(1))
+            if line_match and line_match.group("year") and year is None:
+                year = int(line_match.group("year"))
                 consumed = offset + 1
                 continue
             
             # Check for double feature / special info FIRST (so they're not mistaken for director)
-            if "double feature" in line.lower() or "35mm" in line.lower() or "70mm" in line.lower():
+            if "double feature" in line_lower or "35mm" in line_lower or "70mm" in line_lower:
                 extra_info.append(line)
                 consumed = offset + 1
                 continue
-            
+
             # Check for special event markers
-            special_markers = ["in person", "q&a", "discussion", "seminar", "live score", "sing-along"]
-            if any(marker in line.lower() for marker in special_markers):
+            if _SPECIAL_MARKER_RE.search(line_lower):
                 extra_info.append(line)
                 consumed = offset + 1
                 continue
@@ -234,10 +297,10 @@ class ScreenBostonScraper(BaseScraper):
             # Check for director line (name without numbers, not a venue, not too long, not double-feature text)
             if (title and not director and not venue and 
                 len(line) < 40 and 
-                not re.search(r"\d", line) and
+                not _HAS_DIGIT_RE.search(line) and
                 not self._extract_venue(line) and
                 not self._is_date_header(line) and
-                "double feature" not in line.lower()):
+                "double feature" not in line_lower):
                 # Likely a director name
                 director = line
                 consumed = offset + 1
@@ -278,20 +341,8 @@ class ScreenBostonScraper(BaseScraper):
     
     def _extract_venue(self, text: str) -> Optional[str]:
         """Extract venue name from text."""
-        text_lower = text.lower().strip()
-        
-        for venue_name, patterns in self.VENUES.items():
-            for pattern in patterns:
-                if pattern == text_lower or text_lower.startswith(pattern):
-                    return venue_name
-        
-        return None
+        return _extract_venue(text)
     
     def _parse_runtime_str(self, runtime_str: str) -> Optional[int]:
         """Parse a runtime string like '1h 59m' into minutes."""
-        match = re.search(r"(\d+)h\s*(\d*)m?", runtime_str)
-        if match:
-            hours = int(match.group(1))
-            minutes = int(match.group(2)) if match.group(2) else 0
-            return hours * 60 + minutes
-        return None
+        return _parse_runtime_str(runtime_str)
@@ -1,12 +1,37 @@
 """Flask application for CinemaCal webapp."""
 
 import logging
+
+import orjson
 from flask import Flask
-from flask_cors import CORS
+from flask.json.provider import JSONProvider
 
 logger = logging.getLogger(__name__)
 
 
+class OrJSONProvider(JSONProvider):
+    """JSON provider backed by orjson.
+
+    The screenings and job-status endpoints serialize hundreds of dicts per
+    response; orjson does that in native code and handles date/datetime
+    values directly. response() hands Flask the bytes as-is so large
+    payloads skip the str round-trip.
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS),
+            mimetype="application/json",
+        )
+
+
 def create_app():
     """Create and configure Flask application."""
     app = Flask(
@@ -15,19 +40,37 @@ def create_app():
         static_folder="static",
         static_url_path="/static"
     )
-    
-    # Enable CORS for local development
-    CORS(app)
-    
+    app.json = OrJSONProvider(app)
+
+    # Enable CORS for local development; the import stays behind the flag so
+    # production workers don't pay for flask_cors at boot
+    app.config.setdefault("ENABLE_CORS", True)
+    if app.config["ENABLE_CORS"]:
+        from flask_cors import CORS
+        CORS(app)
+
     # Register blueprints
     from .routes import api_bp
     app.register_blueprint(api_bp)
-    
+
+    # Compile the index template once at startup instead of looking it up
+    # (and possibly parsing it) on every hit to /
+    index_template = app.jinja_env.get_template("index.html")
+
     # Register root route
     @app.route("/")
     def index():
         """Serve the main page."""
-        from flask import render_template
-        return render_template("index.html")
-    
+        return index_template.render()
+
     return app
+
+
+def create_asgi_app():
+    """Wrap the Flask app for an ASGI server (uvicorn).
+
+    WsgiToAsgi runs each request on a worker thread, so long scrape/export
+    handlers no longer serialize the whole server.
+    """
+    from asgiref.wsgi import WsgiToAsgi
+    return WsgiToAsgi(create_app())
@@ -1,13 +1,11 @@
 """API routes for CinemaCal webapp."""
 
 import logging
-from flask import Blueprint, request, jsonify, send_file
+import orjson
+from flask import Blueprint, Response, request, jsonify, stream_with_context
 from datetime import date, datetime
-import tempfile
-import os
-
 from ...models import ScraperConfig, Screening
-from ...export.ics import export_to_ics
+from ...export.ics import iter_ics_chunks
 from ...export.google_calendar import (
     is_google_calendar_configured,
     export_to_google_calendar,
@@ -20,7 +18,13 @@ from ...export.google_calendar import (
     get_calendar_list,
 )
 from ...export.ics import get_import_instructions
-from .tasks import start_scrape_job, get_job_status, serialize_job_status, filter_regular_coolidge
+from .tasks import (
+    DATE_TIME_KEY,
+    start_scrape_job,
+    get_job_status,
+    serialize_job_status,
+    filter_regular_coolidge,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -68,7 +72,12 @@ def scrape_status(job_id: str):
     
     if not job:
         return jsonify({"error": "Job not found"}), 404
-    
+
+    # Completed jobs carry their status payload pre-encoded; polls after
+    # completion skip reserializing the full screenings list
+    if job.status == "complete" and job._status_payload is not None:
+        return Response(job._status_payload, mimetype="application/json")
+
     return jsonify(serialize_job_status(job))
 
 
@@ -92,27 +101,47 @@ def get_screenings():
     screenings = job.screenings
     venue_filter = request.args.get("venue")
     search_filter = request.args.get("search", "").lower()
-    
-    filtered = []
-    for screening in screenings:
-        if venue_filter and venue_filter != "All" and screening.venue != venue_filter:
-            continue
-        if search_filter and search_filter not in screening.title.lower():
-            continue
-        filtered.append(screening)
-    
     exclude_regular = request.args.get("exclude_regular_coolidge", "").lower() in ("1", "true", "yes")
+
+    # The frontend polls with unchanged filters; serve repeats from the
+    # per-job response cache instead of refiltering and re-encoding
+    cache_key = (venue_filter, search_filter, exclude_regular)
+    cached = job._response_cache.get(cache_key)
+    if cached is not None:
+        return Response(cached, mimetype="application/json")
+
+    # Hoist the filter branches and specialize the loop for the frontend's
+    # common shapes: initial load (no filters), a venue tab click, a search
+    vf = venue_filter if venue_filter and venue_filter != "All" else None
+    sf = search_filter or None
+    if vf is None and sf is None:
+        filtered = list(screenings)
+    elif sf is None:
+        filtered = [s for s in screenings if s.venue == vf]
+    else:
+        # Search against the lowercased titles built when the scrape
+        # finished, rebuilding only if the list is out of step with the job
+        title_lowers = job._title_lowers
+        if len(title_lowers) != len(screenings):
+            title_lowers = [s.title.lower() for s in screenings]
+        filtered = [
+            s for s, tl in zip(screenings, title_lowers)
+            if (vf is None or s.venue == vf) and sf in tl
+        ]
+
     if exclude_regular:
         filtered = filter_regular_coolidge(filtered)
-    
+
     # Sort by earliest to latest (date, then time)
-    filtered.sort(key=lambda s: (s.date, s.time))
-    
+    filtered.sort(key=DATE_TIME_KEY)
+
     from .tasks import serialize_screening
-    return jsonify({
+    body = orjson.dumps({
         "screenings": [serialize_screening(s) for s in filtered],
         "count": len(filtered)
     })
+    job._response_cache[cache_key] = body
+    return Response(body, mimetype="application/json")
 
 
 @api_bp.route("/venues", methods=["GET"])
@@ -145,45 +174,16 @@ def export_ics():
             return jsonify({"error": "screenings array required"}), 400
         
         # Reconstruct Screening objects from JSON
-        screenings = []
-        for s_data in data["screenings"]:
-            screening = Screening(
-                title=s_data["title"],
-                venue=s_data["venue"],
-                date=date.fromisoformat(s_data["date"]),
-                time=datetime.strptime(s_data["time"], "%H:%M:%S").time(),
-                source_url=s_data["source_url"],
-                source_site=s_data["source_site"],
-                runtime_minutes=s_data.get("runtime_minutes"),
-                director=s_data.get("director"),
-                year=s_data.get("year"),
-                extra=s_data.get("extra"),
-                special_attributes=s_data.get("special_attributes") or None,
-            )
-            screenings.append(screening)
-        
-        # Create temporary file
-        fd, filepath = tempfile.mkstemp(suffix=".ics")
-        os.close(fd)
-        
-        try:
-            # Export to file
-            export_to_ics(screenings, filepath)
-            
-            # Send file
-            return send_file(
-                filepath,
-                mimetype="text/calendar",
-                as_attachment=True,
-                download_name="screenings.ics"
-            )
-        finally:
-            # Clean up temp file after sending
-            try:
-                os.unlink(filepath)
-            except:
-                pass
-        
+        screenings = [Screening.from_dict(d) for d in data["screenings"]]
+
+        # Stream events straight into the response: no tempfile, no joined
+        # buffer, and the first bytes go out before the last event renders
+        return Response(
+            stream_with_context(iter_ics_chunks(screenings)),
+            mimetype="text/calendar",
+            headers={"Content-Disposition": 'attachment; filename="screenings.ics"'},
+        )
+
     except Exception as e:
         logger.error(f"Error exporting ICS: {e}")
         return jsonify({"error": str(e)}), 500
@@ -205,23 +205,8 @@ def export_google():
             return jsonify({"error": "screenings array required"}), 400
         
         # Reconstruct Screening objects from JSON
-        screenings = []
-        for s_data in data["screenings"]:
-            screening = Screening(
-                title=s_data["title"],
-                venue=s_data["venue"],
-                date=date.fromisoformat(s_data["date"]),
-                time=datetime.strptime(s_data["time"], "%H:%M:%S").time(),
-                source_url=s_data["source_url"],
-                source_site=s_data["source_site"],
-                runtime_minutes=s_data.get("runtime_minutes"),
-                director=s_data.get("director"),
-                year=s_data.get("year"),
-                extra=s_data.get("extra"),
-                special_attributes=s_data.get("special_attributes") or None,
-            )
-            screenings.append(screening)
-        
+        screenings = [Screening.from_dict(d) for d in data["screenings"]]
+
         # Export to Google Calendar
         success, failed = export_to_google_calendar(screenings)
         
@@ -262,12 +247,9 @@ def get_calendar_target():
         }), 400
     try:
         calendar_id = get_movie_screenings_calendar_id()
-        calendars = get_calendar_list()
-        summary = calendar_id
-        for cal in calendars:
-            if cal.get("id") == calendar_id:
-                summary = cal.get("summaryOverride") or cal.get("summary") or calendar_id
-                break
+        by_id = {c["id"]: c for c in get_calendar_list()}
+        cal = by_id.get(calendar_id)
+        summary = (cal.get("summaryOverride") or cal.get("summary") or calendar_id) if cal else calendar_id
         return jsonify({"calendar_id": calendar_id, "summary": summary})
     except Exception as e:
         logger.error(f"Error getting target calendar: {e}")
@@ -317,19 +299,7 @@ def add_calendar_event():
     if not data:
         return jsonify({"error": "JSON body with screening data required"}), 400
     try:
-        screening = Screening(
-            title=data["title"],
-            venue=data["venue"],
-            date=date.fromisoformat(data["date"]),
-            time=datetime.strptime(data["time"], "%H:%M:%S").time(),
-            source_url=data["source_url"],
-            source_site=data["source_site"],
-            runtime_minutes=data.get("runtime_minutes"),
-            director=data.get("director"),
-            year=data.get("year"),
-            extra=data.get("extra"),
-            special_attributes=data.get("special_attributes") or None,
-        )
+        screening = Screening.from_dict(data)
     except (KeyError, ValueError) as e:
         return jsonify({"error": f"Invalid screening data: {e}"}), 400
     try:
@@ -3,10 +3,16 @@
 import logging
 import threading
 import uuid
-from collections import defaultdict
+
+import orjson
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date
 from typing import Dict, Optional, List
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from time import monotonic
 
 from ...models import Screening, ScraperConfig, VENUE_ADDRESSES
 from ...scrapers import (
@@ -23,6 +29,25 @@ COOLIDGE_VENUE_NAME = "Coolidge Corner Theatre"
 MIN_DAYS_REGULAR_COOLIDGE = 5
 MIN_SHOWTIMES_REGULAR_COOLIDGE = 10
 
+# Which source site is authoritative for each venue during deduplication
+_VENUE_TO_PREFERRED_SITE = {
+    "Coolidge Corner Theatre": "Coolidge",
+    "The Brattle": "Brattle",
+    "Harvard Film Archive": "Harvard Film Archive",
+}
+
+
+# C-implemented sort key; avoids a Python lambda call per comparison
+DATE_TIME_KEY = attrgetter("date", "time")
+
+
+def _dedup_priority(s: Screening) -> int:
+    """Rank a screening's source: the venue's own site beats other theater
+    sites, which beat the Screen Boston aggregate."""
+    if s.source_site == _VENUE_TO_PREFERRED_SITE.get(s.venue):
+        return 2
+    return 0 if s.source_site == "Screen Boston" else 1
+
 
 def filter_regular_coolidge(
     screenings: List[Screening],
@@ -34,25 +59,27 @@ def filter_regular_coolidge(
     A Coolidge title is regular if it has >= min_days distinct dates or
     >= min_showtimes total showtimes. Other venues are unchanged.
     """
-    coolidge = [s for s in screenings if s.venue == COOLIDGE_VENUE_NAME]
-    if not coolidge:
+    # Accumulate counts and date sets per title; no need to hold the
+    # Screening objects themselves just to size their groups
+    showtimes: Counter = Counter()
+    dates: Dict[str, set] = defaultdict(set)
+    for s in screenings:
+        if s.venue == COOLIDGE_VENUE_NAME:
+            showtimes[s.title] += 1
+            dates[s.title].add(s.date)
+    if not showtimes:
         return screenings
-    by_title: Dict[str, List[Screening]] = defaultdict(list)
-    for s in coolidge:
-        by_title[s.title].append(s)
-    regular_titles = set()
-    for title, group in by_title.items():
-        distinct_dates = len(set(s.date for s in group))
-        total_showtimes = len(group)
-        if distinct_dates >= min_days or total_showtimes >= min_showtimes:
-            regular_titles.add(title)
+    regular_titles = {
+        title for title, count in showtimes.items()
+        if count >= min_showtimes or len(dates[title]) >= min_days
+    }
     return [
         s for s in screenings
         if not (s.venue == COOLIDGE_VENUE_NAME and s.title in regular_titles)
     ]
 
 
-@dataclass
+@dataclass(slots=True)
 class JobStatus:
     """Status of a scraping job."""
     job_id: str
@@ -61,14 +88,43 @@ class JobStatus:
     message: str = ""
     screenings: List[Screening] = None
     error: Optional[str] = None
-    
+    # Serialized /api/screenings responses keyed by filter combination; the
+    # frontend polls with the same filters repeatedly, so repeats are a
+    # dict lookup instead of a filter + serialize pass
+    _response_cache: Dict[tuple, bytes] = field(default_factory=dict)
+    # Lowercased titles, parallel to screenings; built once per scrape so
+    # search requests don't re-lower every title on every poll
+    _title_lowers: List[str] = field(default_factory=list)
+    # Monotonic creation time, used for TTL eviction from the job store
+    _created_at: float = field(default_factory=monotonic, repr=False, compare=False)
+    # Full status payload, encoded once on completion; polls after that
+    # return these bytes instead of reserializing every screening
+    _status_payload: Optional[bytes] = field(default=None, repr=False, compare=False)
+
     def __post_init__(self):
         if self.screenings is None:
             self.screenings = []
 
 
-# In-memory job storage (for MVP)
+# In-memory job storage (for MVP). Bounded: completed jobs hold full
+# screening lists, so without eviction a long-lived server accumulates
+# every scrape ever run. Dicts iterate in insertion order, so the first
+# entries are always the oldest and pruning pops from the front.
+JOB_TTL_SECONDS = 3600
+MAX_JOBS = 128
+
 _jobs: Dict[str, JobStatus] = {}
+_jobs_lock = threading.Lock()
+
+
+def _prune_jobs_locked():
+    """Evict expired and excess jobs; caller holds _jobs_lock."""
+    cutoff = monotonic() - JOB_TTL_SECONDS
+    expired = [job_id for job_id, job in _jobs.items() if job._created_at < cutoff]
+    for job_id in expired:
+        del _jobs[job_id]
+    while len(_jobs) > MAX_JOBS:
+        del _jobs[next(iter(_jobs))]
 
 
 def start_scrape_job(config: ScraperConfig) -> str:
@@ -89,8 +145,10 @@ def start_scrape_job(config: ScraperConfig) -> str:
         progress=0,
         message="Starting scrape..."
     )
-    _jobs[job_id] = job
-    
+    with _jobs_lock:
+        _prune_jobs_locked()
+        _jobs[job_id] = job
+
     # Start background thread
     thread = threading.Thread(target=_do_scrape, args=(job_id, config), daemon=True)
     thread.start()
@@ -98,6 +156,9 @@ def start_scrape_job(config: ScraperConfig) -> str:
     return job_id
 
 
+# The same handful of venue strings recur for every screening, and each
+# uncached call substring-scans all of VENUE_ADDRESSES
+@lru_cache(maxsize=256)
 def _canonical_venue(venue: str) -> str:
     """Return a canonical venue name for grouping (e.g. 'Brattle' -> 'The Brattle')."""
     if not venue:
@@ -157,22 +218,24 @@ def _merge_double_screenings(screenings: List[Screening]) -> List[Screening]:
     - director: "{Director 1} + {Director 2}" or just director if same
     - runtime_minutes: sum of runtimes
     """
-    # Pass 1: group by canonical venue + date + time
+    # Pass 1: group by canonical venue + date + time. Each slot's key is
+    # kept alongside its screening so pass 2 sorts and compares the
+    # precomputed tuples instead of re-canonicalizing venues
     key_to_list: Dict[tuple, List[Screening]] = defaultdict(list)
     for s in screenings:
         key = (_canonical_venue(s.venue), s.date, s.time)
         key_to_list[key].append(s)
-    
-    result: List[Screening] = []
+
+    result: List[tuple] = []  # (key, screening)
     for key, group in key_to_list.items():
         if len(group) == 1:
-            result.append(group[0])
+            result.append((key, group[0]))
             continue
         # Same slot, multiple screenings: only merge if they're different films.
         # Same title = duplicate showtimes of one film (e.g. Coolidge listing same time twice) → keep one.
         titles = [s.title for s in group]
         if len(set(titles)) == 1:
-            result.append(group[0])
+            result.append((key, group[0]))
             continue
         first = group[0]
         combined_title = " + ".join(titles)
@@ -205,32 +268,40 @@ def _merge_double_screenings(screenings: List[Screening]) -> List[Screening]:
             extra=combined_extra,
             special_attributes=combined_special,
         )
-        result.append(merged)
-    
+        result.append((key, merged))
+
     # Pass 2: screenings with "Double feature" that weren't merged (e.g. second
-    # film had a different time) — merge with the next screening at same venue/date
-    result.sort(key=lambda s: (_canonical_venue(s.venue), s.date, s.time))
+    # film had a different time) — merge with the next screening at same venue/date.
+    # Usually nothing carries the attribute, so skip the sort-and-walk outright;
+    # callers re-sort the combined list themselves.
+    if not any(
+        s.special_attributes and "Double feature" in s.special_attributes
+        for _, s in result
+    ):
+        return [s for _, s in result]
+
+    result.sort(key=itemgetter(0))
     out: List[Screening] = []
     i = 0
     while i < len(result):
-        s = result[i]
+        key, s = result[i]
         has_double_feature = (
             s.special_attributes
             and "Double feature" in s.special_attributes
         )
         next_same_venue_date = (
             i + 1 < len(result)
-            and _canonical_venue(result[i + 1].venue) == _canonical_venue(s.venue)
-            and result[i + 1].date == s.date
+            # key[:2] is (canonical venue, date)
+            and result[i + 1][0][:2] == key[:2]
         )
         if has_double_feature and next_same_venue_date:
-            merged = _merge_two_screenings(s, result[i + 1])
+            merged = _merge_two_screenings(s, result[i + 1][1])
             out.append(merged)
             i += 2
             continue
         out.append(s)
         i += 1
-    
+
     return out
 
 
@@ -247,49 +318,22 @@ def _deduplicate_screenings(screenings: List[Screening]) -> List[Screening]:
     Returns:
         Deduplicated list of screenings
     """
-    # Map venue names to their preferred source sites
-    venue_to_preferred_site = {
-        "Coolidge Corner Theatre": "Coolidge",
-        "The Brattle": "Brattle",
-        "Harvard Film Archive": "Harvard Film Archive",
-    }
-    
     # Track unique screenings by (title, venue, date, time)
     seen: Dict[tuple, Screening] = {}
-    
+
+    # Strict > keeps the first of equal-priority duplicates
     for screening in screenings:
         key = (screening.title, screening.venue, screening.date, screening.time)
-        
-        if key not in seen:
-            # First occurrence, keep it
+        existing = seen.get(key)
+        if existing is None or _dedup_priority(screening) > _dedup_priority(existing):
             seen[key] = screening
-        else:
-            # Duplicate found
-            existing = seen[key]
-            
-            # If same source site, skip (keep the first one)
-            if existing.source_site == screening.source_site:
-                continue
-            
-            # Cross-site duplicate - decide which to keep
-            # Prefer theater's own site over Screen Boston
-            preferred_site = venue_to_preferred_site.get(screening.venue)
-            
-            # If current screening is from preferred site, replace
-            if screening.source_site == preferred_site:
-                seen[key] = screening
-            # If existing is from Screen Boston and current is from a theater site, replace
-            elif existing.source_site == "Screen Boston" and screening.source_site != "Screen Boston":
-                seen[key] = screening
-            # Otherwise keep existing (it's already preferred or from a theater site)
-            # No action needed
-    
+
     return list(seen.values())
 
 
 def _do_scrape(job_id: str, config: ScraperConfig):
     """Perform scraping in background thread."""
-    job = _jobs.get(job_id)
+    job = get_job_status(job_id)
     if not job:
         return
     
@@ -312,21 +356,37 @@ def _do_scrape(job_id: str, config: ScraperConfig):
             scrapers.append(("Brattle", BrattleScraper(config)))
         
         total_scrapers = len(scrapers)
-        
-        # Run each scraper
-        for idx, (name, scraper) in enumerate(scrapers):
-            try:
-                job.message = f"Scraping {name}..."
-                job.progress = int((idx / total_scrapers) * 90)
-                
-                logger.info(f"Scraping {name}...")
-                results = scraper.scrape()
-                screenings.extend(results)
-                
-                logger.info(f"Found {len(results)} screenings from {name}")
-            except Exception as e:
-                logger.error(f"Error scraping {name}: {e}")
-                continue
+
+        # Run scrapers concurrently: the work is network-bound, so threads
+        # overlap the socket waits and wall time drops from the sum of the
+        # venue latencies to roughly the slowest one
+        results_by_name: Dict[str, List[Screening]] = {}
+        if scrapers:
+            job.message = "Scraping venues..."
+            done_count = 0
+            with ThreadPoolExecutor(
+                max_workers=min(8, total_scrapers), thread_name_prefix="scrape"
+            ) as executor:
+                future_to_name = {
+                    executor.submit(scraper.scrape): name for name, scraper in scrapers
+                }
+                for future in as_completed(future_to_name):
+                    name = future_to_name[future]
+                    done_count += 1
+                    try:
+                        results = future.result()
+                        logger.info(f"Found {len(results)} screenings from {name}")
+                    except Exception as e:
+                        logger.error(f"Error scraping {name}: {e}")
+                        results = []
+                    results_by_name[name] = results
+                    job.progress = int((done_count / total_scrapers) * 90)
+                    job.message = f"Scraped {name} ({done_count}/{total_scrapers})"
+
+        # Collect in the configured scraper order so downstream dedup keeps
+        # its first-occurrence preference deterministic
+        for name, _ in scrapers:
+            screenings.extend(results_by_name.get(name, ()))
         
         # Merge double screenings (same venue, date, time → one combined screening)
         screenings = _merge_double_screenings(screenings)
@@ -339,13 +399,21 @@ def _do_scrape(job_id: str, config: ScraperConfig):
             logger.info(f"Removed {removed_count} duplicate screening(s)")
         
         # Sort by earliest to latest (date, then time)
-        screenings.sort(key=lambda s: (s.date, s.time))
+        screenings.sort(key=DATE_TIME_KEY)
         
-        # Complete
-        job.status = "complete"
+        # Complete. Results are populated before the status flips: a request
+        # that observes "complete" must never see the empty screenings list,
+        # or it would cache an empty response for its filter combination.
+        job.screenings = screenings
+        job._title_lowers = [s.title.lower() for s in screenings]
+        job._response_cache.clear()
         job.progress = 100
         job.message = f"Found {len(screenings)} screenings"
-        job.screenings = screenings
+        job.status = "complete"
+        # Encode the final status once; every subsequent poll reuses it.
+        # Polls landing before this write serialize the live job, which is
+        # already fully populated.
+        job._status_payload = orjson.dumps(serialize_job_status(job))
         
         logger.info(f"Scraping complete: {len(screenings)} screenings")
         
@@ -365,7 +433,8 @@ def get_job_status(job_id: str) -> Optional[JobStatus]:
     Returns:
         JobStatus object or None if not found
     """
-    return _jobs.get(job_id)
+    with _jobs_lock:
+        return _jobs.get(job_id)
 
 
 def serialize_screening(screening: Screening) -> dict: